@@ -0,0 +1,92 @@
+"""Command line entry point: ``python -m benchmarks``.
+
+Runs the suite under the SDL dummy drivers, writes machine-tagged JSON
+results and compares them with the stored baseline for this machine::
+
+    python -m benchmarks                      # run and compare
+    python -m benchmarks --save-baseline      # record a new baseline
+    python -m benchmarks -k snake --tolerance 0.1
+
+The exit status is 1 when any benchmark is slower than the baseline by more
+than the tolerance, or when this machine has no baseline (unless
+``--allow-missing-baseline`` is given), so the command can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks import cases  # noqa: E402,F401  (registers benchmarks)
+from benchmarks.harness import BENCHMARKS, compare, machine_tag, read_results, run, write_results  # noqa: E402
+
+BENCH_DIR = os.path.join(ROOT, "benchmarks")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run performance benchmarks")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains this string")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum duration of one round in seconds")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<tag>-<time>.json)")
+    parser.add_argument("--baseline", help="Baseline file (default: benchmarks/baselines/<tag>.json)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown, e.g. 0.25 = 25%%")
+    parser.add_argument("--metric", choices=("min", "median", "mean"), default="median")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument(
+        "--allow-missing-baseline", action="store_true", help="Succeed without comparing if no baseline exists"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    tag = machine_tag()
+    names = [name for name in BENCHMARKS if not args.pattern or args.pattern in name]
+    if not names:
+        print(f"No benchmarks match {args.pattern!r}", file=sys.stderr)
+        return 2
+
+    results = run(names, rounds=args.rounds, min_time=args.min_time)
+    for r in results:
+        print(f"{r.name:<34} {r.median * 1e6:>12.1f} us  (min {r.min * 1e6:.1f}, {r.loops} loops)")
+
+    output = args.output or os.path.join(BENCH_DIR, "results", f"{tag}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    write_results(output, results)
+    print(f"Results written to {output}")
+
+    baseline_path = args.baseline or os.path.join(BENCH_DIR, "baselines", f"{tag}.json")
+    if args.save_baseline:
+        write_results(baseline_path, results)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+    if not os.path.exists(baseline_path):
+        print(f"No baseline for machine {tag!r} at {baseline_path}", file=sys.stderr)
+        if args.allow_missing_baseline:
+            return 0
+        print("Record one with --save-baseline or pass --allow-missing-baseline", file=sys.stderr)
+        return 1
+
+    regressions = compare(results, read_results(baseline_path), args.tolerance, args.metric)
+    if regressions:
+        print(f"\nPERFORMANCE REGRESSION (tolerance {args.tolerance:.0%}, metric {args.metric}):", file=sys.stderr)
+        for cmp in regressions:
+            print(
+                f"  {cmp.name}: {cmp.baseline * 1e6:.1f} us -> {cmp.current * 1e6:.1f} us ({cmp.ratio:.2f}x)",
+                file=sys.stderr,
+            )
+        return 1
+    print(f"No regressions against {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
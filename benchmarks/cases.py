@@ -0,0 +1,133 @@
+"""Benchmarks for the hot paths of the game and engine.
+
+Importing this module registers every benchmark.  SDL must already be set
+up with the dummy drivers (see :mod:`benchmarks.__main__`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import random
+import tempfile
+
+import pygame
+
+from .harness import benchmark
+
+SNAKE_LENGTH = 10_000
+BOARD_SIZE = 100
+BOARD_FILL = 0.9
+MESH_VERTICES = 20_000
+
+
+def _ensure_display() -> None:
+    if pygame.display.get_surface() is None:
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+
+@benchmark("snake_move_long_body")
+def _snake_move():
+    from game.snake import Snake
+
+    snake = Snake(initial_length=SNAKE_LENGTH, start_pos=(SNAKE_LENGTH, 0))
+    moves = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+    state = {"step": 0}
+
+    def step():
+        # Walk a small square so the body length stays constant
+        state["step"] += 1
+        snake.set_direction(moves[(state["step"] // 4) % 4])
+        snake.move()
+
+    return step
+
+
+@benchmark("snake_self_collision_long_body")
+def _snake_self_collision():
+    from game.snake import Snake
+
+    snake = Snake(initial_length=SNAKE_LENGTH, start_pos=(SNAKE_LENGTH, 0))
+    return snake.check_self_collision
+
+
+@benchmark("food_spawn_crowded_board")
+def _food_spawn():
+    from game.food import Food
+
+    cells = [(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
+    rng = random.Random(1)
+    rng.shuffle(cells)
+    occupied = cells[: int(len(cells) * BOARD_FILL)]
+    food = Food(BOARD_SIZE, BOARD_SIZE)
+    random.seed(1)
+    return lambda: food.spawn(occupied)
+
+
+@benchmark("load_permafrost_large_mesh")
+def _load_permafrost():
+    from engine.permafrost import load_permafrost
+
+    fd, path = tempfile.mkstemp(suffix=".pfr")
+    atexit.register(os.remove, path)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write("permafrost_ascii 1.0\n")
+        fh.write(f"vertices {MESH_VERTICES}\n")
+        for i in range(MESH_VERTICES):
+            fh.write(f"{i * 0.5} {i * 0.25} {i * 0.125}\n")
+        faces = MESH_VERTICES - 2
+        fh.write(f"faces {faces}\n")
+        for i in range(faces):
+            fh.write(f"{i} {i + 1} {i + 2}\n")
+    return lambda: load_permafrost(path)
+
+
+@benchmark("load_sprite")
+def _load_sprite():
+    from engine.assets import load_sprite
+
+    _ensure_display()
+    return lambda: load_sprite("snake.png")
+
+
+@benchmark("audio_generate_beep")
+def _generate_beep():
+    from engine.audio import audio
+
+    return lambda: audio._generate_beep(880)
+
+
+@benchmark("phong_surface_uncached")
+def _phong_surface():
+    from engine.shading import clear_phong_cache, phong_surface
+
+    _ensure_display()
+
+    def shade():
+        clear_phong_cache()
+        phong_surface((83, 224, 73), 40, (-1, -1))
+
+    return shade
+
+
+@benchmark("snake_game_frame")
+def _snake_game_frame():
+    import snake_game
+
+    # No leaderboard: game overs must not reach the player's scores.db
+    main_game = snake_game.Main(records=None)
+    main_game.game_active = True
+    main_game.win_score = -1
+    for _ in range(20):
+        main_game.snake.add_block()
+        main_game.snake.move_snake()
+
+    def frame():
+        main_game.update()
+        main_game.update_effects()
+        if not main_game.game_active:
+            main_game.start_game()
+        snake_game.draw_frame(main_game)
+
+    return frame
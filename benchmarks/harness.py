@@ -0,0 +1,147 @@
+"""Timing, result storage and baseline comparison for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+# A benchmark's setup function prepares state and returns the callable that
+# is timed.  It must be cheap to call many times.
+Setup = Callable[[], Callable[[], object]]
+
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register *setup* as benchmark *name*."""
+
+    def register(setup: Setup) -> Setup:
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+@dataclass
+class Result:
+    """Per-call timings of one benchmark, in seconds."""
+
+    name: str
+    loops: int
+    rounds: int
+    min: float
+    median: float
+    mean: float
+
+
+def machine_info() -> Dict[str, object]:
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "node": platform.node(),
+    }
+
+
+def machine_tag(info: Optional[Dict[str, object]] = None) -> str:
+    """Short identifier of the machine class results were measured on."""
+    info = info or machine_info()
+    return "{system}-{machine}-{cpu_count}cpu-py{python}".format(**info).lower()
+
+
+def measure(name: str, fn: Callable[[], object], rounds: int = 5, min_time: float = 0.05) -> Result:
+    """Time *fn*, calibrating the loop count so each round takes *min_time*."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return Result(
+        name=name,
+        loops=loops,
+        rounds=rounds,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+    )
+
+
+def run(names: Optional[List[str]] = None, rounds: int = 5, min_time: float = 0.05) -> List[Result]:
+    """Run the selected (default: all) registered benchmarks."""
+    results = []
+    for name in names or list(BENCHMARKS):
+        fn = BENCHMARKS[name]()
+        results.append(measure(name, fn, rounds, min_time))
+    return results
+
+
+def write_results(path: str, results: List[Result]) -> None:
+    info = machine_info()
+    data = {
+        "machine": info,
+        "tag": machine_tag(info),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": {r.name: asdict(r) for r in results},
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+
+
+def read_results(path: str) -> Dict[str, Result]:
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    return {name: Result(**values) for name, values in data["results"].items()}
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(
+    current: List[Result],
+    baseline: Dict[str, Result],
+    tolerance: float = 0.25,
+    metric: str = "median",
+) -> List[Comparison]:
+    """Return benchmarks slower than ``baseline * (1 + tolerance)``.
+
+    Benchmarks missing from the baseline are ignored.
+    """
+    regressions = []
+    for result in current:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        cmp = Comparison(result.name, getattr(base, metric), getattr(result, metric))
+        if cmp.current > cmp.baseline * (1 + tolerance):
+            regressions.append(cmp)
+    return regressions
@@ -0,0 +1,115 @@
+"""Offscreen frame capture to raw files or encoder pipes."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+import pygame
+
+Size = Tuple[int, int]
+
+
+def pixel_format(surface: pygame.Surface) -> str:
+    """Name the byte order of a 32-bit *surface* the way ffmpeg does.
+
+    For example ``"bgr0"`` for the usual little-endian XRGB surface.
+    """
+    if surface.get_bytesize() != 4:
+        raise ValueError("Only 32-bit surfaces have a packed pixel format")
+    layout = ["0"] * 4
+    for channel, mask, shift in zip("rgba", surface.get_masks(), surface.get_shifts()):
+        if mask:
+            index = shift // 8
+            layout[index if sys.byteorder == "little" else 3 - index] = channel
+    return "".join(layout)
+
+
+class FileSink:
+    """Append raw frames to a file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: BinaryIO = open(path, "wb")
+
+    def write(self, frame: memoryview) -> None:
+        self._file.write(frame)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class PipeSink:
+    """Stream raw frames into the standard input of *command*."""
+
+    def __init__(self, command: Sequence[str]) -> None:
+        self.command = list(command)
+        self._process = subprocess.Popen(self.command, stdin=subprocess.PIPE)
+
+    def write(self, frame: memoryview) -> None:
+        self._process.stdin.write(frame)
+
+    def close(self) -> None:
+        self._process.stdin.close()
+        code = self._process.wait()
+        if code:
+            raise subprocess.CalledProcessError(code, self.command)
+
+
+def ffmpeg_command(output: str, size: Size, fps: float, pix_fmt: str, ffmpeg: str = "ffmpeg") -> List[str]:
+    """Arguments for an ffmpeg process encoding raw frames from stdin."""
+    width, height = size
+    return [
+        ffmpeg, "-loglevel", "error", "-y",
+        "-f", "rawvideo", "-pix_fmt", pix_fmt, "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "-",
+        "-pix_fmt", "yuv420p", output,
+    ]
+
+
+def open_sink(output: str, size: Size, fps: float, pix_fmt: str):
+    """Raw file sink for ``.raw`` paths, an ffmpeg pipe for anything else."""
+    if output.endswith(".raw"):
+        return FileSink(output)
+    return PipeSink(ffmpeg_command(output, size, fps, pix_fmt))
+
+
+class FrameCapture:
+    """Hand the pixels of *surface* to a sink once per frame without copying.
+
+    A 32-bit surface without row padding (such as the display surface under
+    the dummy video driver) is exposed directly through a buffer view.  Any
+    other surface is first blitted into one preallocated 32-bit surface that
+    is reused for every frame.  Sinks receive a :class:`memoryview` that is
+    only valid during the call.
+    """
+
+    def __init__(self, surface: pygame.Surface) -> None:
+        self.surface = surface
+        self.size: Size = surface.get_size()
+        width = self.size[0]
+        if surface.get_bytesize() == 4 and surface.get_pitch() == width * 4:
+            self._buffer: Optional[pygame.Surface] = None
+            self.pixel_format = pixel_format(surface)
+        else:
+            self._buffer = pygame.Surface(self.size, 0, 32)
+            self.pixel_format = pixel_format(self._buffer)
+        self.frame_bytes = self.size[0] * self.size[1] * 4
+        self.frames = 0
+
+    def write(self, sink) -> None:
+        """Pass the current contents of the surface to ``sink.write``."""
+        source = self.surface
+        if self._buffer is not None:
+            self._buffer.blit(source, (0, 0))
+            source = self._buffer
+        # The view keeps the surface locked, so release it before the next blit
+        view = source.get_view("0")
+        with memoryview(view) as frame:
+            sink.write(frame)
+        del view
+        self.frames += 1
+
+
+__all__ = ["FileSink", "PipeSink", "FrameCapture", "ffmpeg_command", "open_sink", "pixel_format"]
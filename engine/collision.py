@@ -0,0 +1,143 @@
+"""Tile-grid collision queries."""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from pygame import Rect
+
+Grid = Sequence[Sequence[int]]
+
+
+class TileCollider:
+    """Resolve rect movement against solid tiles of a grid.
+
+    Only the tiles overlapped by the moving rect are inspected, so the cost
+    of a query depends on the size of the rect, not the size of the map.
+    Tiles outside the grid count as solid.
+    """
+
+    def __init__(self, grid: Grid, tile_size: int, solid: Iterable[int] = (1,)) -> None:
+        self.grid = grid
+        self.tile_size = tile_size
+        self.solid = frozenset(solid)
+        self.height = len(grid)
+        self.width = len(grid[0]) if self.height else 0
+
+    def is_solid(self, tx: int, ty: int) -> bool:
+        if tx < 0 or ty < 0 or tx >= self.width or ty >= self.height:
+            return True
+        return self.grid[ty][tx] in self.solid
+
+    def tile_span(self, rect: Rect):
+        """Return ``(x0, y0, x1, y1)``, the inclusive tile range under *rect*."""
+        ts = self.tile_size
+        return (
+            rect.left // ts,
+            rect.top // ts,
+            (rect.right - 1) // ts,
+            (rect.bottom - 1) // ts,
+        )
+
+    def solid_rects(self, rect: Rect) -> List[Rect]:
+        """Return rects of the solid tiles overlapped by *rect*."""
+        ts = self.tile_size
+        x0, y0, x1, y1 = self.tile_span(rect)
+        return [
+            Rect(tx * ts, ty * ts, ts, ts)
+            for ty in range(y0, y1 + 1)
+            for tx in range(x0, x1 + 1)
+            if self.is_solid(tx, ty)
+        ]
+
+    def collides(self, rect: Rect) -> bool:
+        x0, y0, x1, y1 = self.tile_span(rect)
+        return any(
+            self.is_solid(tx, ty)
+            for ty in range(y0, y1 + 1)
+            for tx in range(x0, x1 + 1)
+        )
+
+    def move(self, rect: Rect, dx: int, dy: int) -> Rect:
+        """Move *rect* in place by ``(dx, dy)``, stopping at solid tiles.
+
+        Axes are resolved separately (horizontal first) so the rect slides
+        along walls.  The rect is returned for convenience.
+        """
+        if dx:
+            rect.x += dx
+            hits = self.solid_rects(rect)
+            if hits:
+                if dx > 0:
+                    rect.right = min(hit.left for hit in hits)
+                else:
+                    rect.left = max(hit.right for hit in hits)
+        if dy:
+            rect.y += dy
+            hits = self.solid_rects(rect)
+            if hits:
+                if dy > 0:
+                    rect.bottom = min(hit.top for hit in hits)
+                else:
+                    rect.top = max(hit.bottom for hit in hits)
+        return rect
+
+
+def merge_solid_tiles(
+    grid: Grid,
+    tile_size: int,
+    solid: Iterable[int] = (1,),
+    region: Optional[Tuple[int, int, int, int]] = None,
+) -> List[Rect]:
+    """Greedily merge adjacent solid tiles into as few rects as possible.
+
+    Runs of solid tiles in a row are grown downwards while the rows below
+    contain the same run.  Useful for rect-based queries such as
+    :meth:`pygame.Rect.collidelistall` and for debug drawing.  *region* is
+    an inclusive tile range ``(x0, y0, x1, y1)`` (as returned by
+    :meth:`TileCollider.tile_span`) that limits the work to part of a large
+    map; rects are clipped to it.
+    """
+    solid = frozenset(solid)
+    height = len(grid)
+    width = len(grid[0]) if height else 0
+    x0, y0, x1, y1 = region if region is not None else (0, 0, width - 1, height - 1)
+    x0, y0 = max(x0, 0), max(y0, 0)
+    x1, y1 = min(x1, width - 1), min(y1, height - 1)
+    used = [[False] * (x1 - x0 + 1) for _ in range(max(0, y1 - y0 + 1))]
+    rects: List[Rect] = []
+    width, height = x1 + 1, y1 + 1
+
+    def free(tx: int, ty: int) -> bool:
+        return not used[ty - y0][tx - x0] and grid[ty][tx] in solid
+
+    for ty in range(y0, height):
+        tx = x0
+        while tx < width:
+            if not free(tx, ty):
+                tx += 1
+                continue
+            run_end = tx
+            while run_end + 1 < width and free(run_end + 1, ty):
+                run_end += 1
+            bottom = ty
+            while bottom + 1 < height and all(
+                free(x, bottom + 1) for x in range(tx, run_end + 1)
+            ):
+                bottom += 1
+            for y in range(ty, bottom + 1):
+                for x in range(tx, run_end + 1):
+                    used[y - y0][x - x0] = True
+            rects.append(
+                Rect(
+                    tx * tile_size,
+                    ty * tile_size,
+                    (run_end - tx + 1) * tile_size,
+                    (bottom - ty + 1) * tile_size,
+                )
+            )
+            tx = run_end + 1
+    return rects
+
+
+__all__ = ["TileCollider", "merge_solid_tiles"]
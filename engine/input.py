@@ -1,6 +1,147 @@
+"""Input subsystem: event draining, timestamping and buffered commands."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+import pygame
+
+
+# Event types the game reacts to.  Everything else (mouse motion, window
+# events, joystick noise...) is blocked inside SDL so it never reaches the
+# Python side of the queue.
+DEFAULT_ALLOWED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+
+
+@dataclass(frozen=True)
+class Command:
+    """A game command produced by an input event."""
+
+    action: Any
+    timestamp: float
+
+
 class InputHandler:
-    """Simple input handler stub."""
+    """Drain the pygame event queue and buffer commands for the simulation.
+
+    :meth:`get_events` should be called exactly once per frame; the time of
+    each poll is kept in :attr:`last_poll`.  Key presses bound with
+    :meth:`bind` are turned into :class:`Command` objects stamped with that
+    poll time and stored in a bounded queue.  Other events are returned
+    as-is, without timestamps.  The simulation consumes one command per tick
+    with :meth:`pop_command`, so quick successive key presses are applied on
+    successive ticks instead of overwriting each other.  The command queue
+    and latency samples are guarded by a lock, so events can be polled on
+    the render thread while a simulation thread consumes the commands.
+    """
+
+    def __init__(
+        self,
+        max_commands: int = 3,
+        allowed_events: Optional[Iterable[int]] = DEFAULT_ALLOWED_EVENTS,
+        clock: Callable[[], float] = time.perf_counter,
+        latency_window: int = 256,
+    ) -> None:
+        self.clock = clock
+        self.max_commands = max_commands
+        self.commands: Deque[Command] = deque()
+        self._lock = threading.Lock()
+        self.bindings: Dict[int, Any] = {}
+        self.last_poll = 0.0
+        self.dropped = 0
+        self.latencies: Deque[float] = deque(maxlen=latency_window)
+        self.allowed_events = list(allowed_events) if allowed_events is not None else None
+        if self.allowed_events is not None and pygame.display.get_init():
+            self.install_filter()
+
+    # Event filtering ---------------------------------------------------
+    def install_filter(self) -> None:
+        """Block all event types at the SDL level except the allowed ones."""
+        if self.allowed_events is None:
+            return
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.allowed_events)
+
+    def allow(self, *event_types: int) -> None:
+        """Add *event_types* (e.g. custom ``USEREVENT`` ids) to the filter."""
+        if self.allowed_events is None:
+            return
+        for event_type in event_types:
+            if event_type not in self.allowed_events:
+                self.allowed_events.append(event_type)
+        if pygame.display.get_init():
+            pygame.event.set_allowed(list(event_types))
+
+    # Key bindings ------------------------------------------------------
+    def bind(self, key: int, action: Any) -> None:
+        """Queue *action* as a command whenever *key* is pressed."""
+        self.bindings[key] = action
+
+    def get_events(self) -> List[pygame.event.Event]:
+        """Drain the pygame queue once and return the events.
+
+        Bound key presses are additionally converted into commands.
+        """
+        events = pygame.event.get()
+        now = self.clock()
+        self.last_poll = now
+        if self.bindings:
+            for event in events:
+                if event.type == pygame.KEYDOWN and event.key in self.bindings:
+                    self.push_command(self.bindings[event.key], now)
+        return events
+
+    # Command queue -----------------------------------------------------
+    def push_command(self, action: Any, timestamp: Optional[float] = None) -> bool:
+        """Append *action* to the command queue.
+
+        Repeats of the last queued action are ignored.  When the queue is
+        full the new command is dropped and ``False`` is returned.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        with self._lock:
+            if self.commands and self.commands[-1].action == action:
+                return False
+            if len(self.commands) >= self.max_commands:
+                self.dropped += 1
+                return False
+            self.commands.append(Command(action, timestamp))
+        return True
+
+    def pop_command(self) -> Optional[Command]:
+        """Return the oldest buffered command or ``None`` if there is none.
+
+        The time between the key press and this call is recorded as the
+        input-to-tick latency.
+        """
+        with self._lock:
+            if not self.commands:
+                return None
+            command = self.commands.popleft()
+            self.latencies.append(self.clock() - command.timestamp)
+        return command
+
+    def clear(self) -> None:
+        """Discard all buffered commands."""
+        with self._lock:
+            self.commands.clear()
+
+    # Latency statistics ------------------------------------------------
+    def average_latency(self) -> float:
+        """Mean input-to-tick latency in seconds over the recent window."""
+        with self._lock:
+            samples = list(self.latencies)
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples)
 
-    def get_events(self):
-        """Return a list of input events."""
-        return []
+    def max_latency(self) -> float:
+        """Worst input-to-tick latency in seconds over the recent window."""
+        with self._lock:
+            samples = list(self.latencies)
+        return max(samples, default=0.0)
@@ -1,4 +1,8 @@
 import time
+from contextlib import nullcontext
+
+from .scheduler import Scheduler
+from .simulation import SimulationThread
 
 
 class Scene:
@@ -19,38 +23,119 @@ class Scene:
         """Render scene using the provided renderer."""
         return None
 
+    def snapshot(self):
+        """Return an immutable copy of the state needed to draw the scene.
+
+        Only used in threaded mode, where it is called on the simulation
+        thread after every tick.
+        """
+        return None
+
+    def render_state(self, renderer, state):
+        """Render a state returned by :meth:`snapshot` (threaded mode)."""
+        return self.render(renderer)
+
 
 class Game:
     """Core game application managing the main loop and scenes."""
 
-    def __init__(self, renderer, input_handler, start_scene, fps=60):
+    def __init__(self, renderer, input_handler, start_scene, fps=60, memory=None, tick_rate=None):
         self.renderer = renderer
         self.input = input_handler
         self.scene = start_scene
         self.scene.game = self
         self.fps = fps
         self.running = False
+        # Optional FrameMemoryManager taking over garbage collection
+        self.memory = memory
+        # Timers for fixed-rate ticks and delayed jobs, run before each update
+        self.scheduler = Scheduler()
+        # With a tick rate the scene is updated on a separate simulation
+        # thread and the main thread renders the latest published snapshot
+        self.tick_rate = tick_rate
+        self.simulation = None
 
     def change_scene(self, scene):
         self.scene = scene
         self.scene.game = self
+        if self.memory and self.running:
+            self.memory.scene_loaded()
 
     def stop(self):
         self.running = False
 
     def run(self):
         self.running = True
+        frames = self._run_frames if self.tick_rate is None else self._run_threaded
+        memory = self.memory
+        if memory is None:
+            frames()
+            return
+        memory.start()
+        memory.scene_loaded()
+        try:
+            frames()
+        finally:
+            memory.stop()
+
+    def _run_frames(self):
+        memory = self.memory
+        no_phase = nullcontext()
+        budget = 1.0 / self.fps
         dt = 0.0
         while self.running:
             start = time.time()
-            events = self.input.get_events()
-            self.scene.handle_input(events)
-            self.scene.update(dt)
-            self.renderer.begin()
-            self.scene.render(self.renderer)
-            self.renderer.end()
+            if memory:
+                memory.begin_frame()
+            with memory.phase("input") if memory else no_phase:
+                events = self.input.get_events()
+                self.scene.handle_input(events)
+            with memory.phase("update") if memory else no_phase:
+                self.scheduler.run_due()
+                self.scene.update(dt)
+            with memory.phase("render") if memory else no_phase:
+                self.renderer.begin()
+                self.scene.render(self.renderer)
+                self.renderer.end()
+            if memory:
+                memory.end_frame(time.time() - start, budget)
             dt = time.time() - start
-            delay = max(1.0 / self.fps - dt, 0)
+            delay = max(budget - dt, 0)
             if delay:
                 time.sleep(delay)
                 dt += delay
+
+    def _run_threaded(self):
+        memory = self.memory
+        no_phase = nullcontext()
+        budget = 1.0 / self.fps
+        step = 1.0 / self.tick_rate
+        tick = self.scheduler.every(step, lambda: self.scene.update(step))
+        # Each snapshot carries its scene so a scene change never pairs a
+        # state with the wrong renderer
+        sim = self.simulation = SimulationThread(self.scheduler, lambda: (self.scene, self.scene.snapshot()))
+        sim.start()
+        try:
+            while self.running:
+                start = time.perf_counter()
+                sim.check()
+                if memory:
+                    memory.begin_frame()
+                with memory.phase("input") if memory else no_phase:
+                    events = self.input.get_events()
+                    sim.call_soon(self.scene.handle_input, events)
+                with memory.phase("render") if memory else no_phase:
+                    scene, state = sim.buffer.latest()
+                    self.renderer.begin()
+                    scene.render_state(self.renderer, state)
+                    self.renderer.end()
+                elapsed = time.perf_counter() - start
+                if memory:
+                    memory.end_frame(elapsed, budget)
+                delay = budget - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            sim.stop()
+            self.scheduler.cancel(tick)
+            self.simulation = None
@@ -0,0 +1,165 @@
+"""Compact on-disk tilemap format with memory-mapped loading.
+
+Layout (little endian)::
+
+    offset  size  field
+    0       4     magic  b"TMAP"
+    4       2     format version (1)
+    6       2     bytes per tile (1 = uint8, 2 = uint16)
+    8       4     width in tiles
+    12      4     height in tiles
+    16      2     tile size in pixels
+    18      2     layer count
+    20      12    reserved (zero)
+    32      ...   layers, each ``height * width`` tiles in row-major order
+
+Maps are opened with :func:`numpy.memmap`, so loading is instant and only
+the pages that are actually touched are read from disk.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+from .tilemap import TileMap
+
+MAGIC = b"TMAP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIHH12x")
+DTYPES = {1: np.dtype("<u1"), 2: np.dtype("<u2")}
+
+
+@dataclass
+class MapFile:
+    """An opened tilemap file.
+
+    ``layers`` is a read-only (or copy-on-write / read-write, depending on
+    the open mode) memory-mapped array of shape ``(layers, height, width)``.
+    """
+
+    path: str
+    width: int
+    height: int
+    tile_size: int
+    layers: np.ndarray
+
+    @property
+    def layer_count(self) -> int:
+        return self.layers.shape[0]
+
+    def read_region(self, x: int, y: int, w: int, h: int, layer: int = 0) -> np.ndarray:
+        """Copy a ``w`` x ``h`` block of tiles starting at ``(x, y)``.
+
+        Only the rows of the region are paged in, so this works for maps much
+        larger than the available memory.
+        """
+        return np.array(self.layers[layer, y:y + h, x:x + w])
+
+    def iter_regions(self, size: int, layer: int = 0) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """Yield ``(x, y, tiles)`` for every *size* x *size* region in turn."""
+        for y in range(0, self.height, size):
+            for x in range(0, self.width, size):
+                yield x, y, self.read_region(x, y, size, size, layer)
+
+    def tilemap(self, layer: int = 0, chunk_size: int = 32) -> TileMap:
+        """Return a :class:`TileMap` viewing *layer* without copying it."""
+        return TileMap(self.layers[layer], self.tile_size, chunk_size)
+
+
+def read_header(path: str) -> Tuple[int, int, int, int, np.dtype]:
+    """Return ``(width, height, tile_size, layer_count, dtype)`` of *path*."""
+    with open(path, "rb") as fh:
+        data = fh.read(HEADER.size)
+    if len(data) != HEADER.size:
+        raise ValueError("Unsupported or corrupt file format")
+    magic, version, itemsize, width, height, tile_size, layer_count = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION or itemsize not in DTYPES:
+        raise ValueError("Unsupported or corrupt file format")
+    return width, height, tile_size, layer_count, DTYPES[itemsize]
+
+
+def open_map(path: str, mode: str = "r") -> MapFile:
+    """Memory-map the tilemap at *path*.
+
+    *mode* is passed to :func:`numpy.memmap`: ``"r"`` (read-only), ``"c"``
+    (copy-on-write, edits stay in memory) or ``"r+"`` (edits go to disk).
+    """
+    width, height, tile_size, layer_count, dtype = read_header(path)
+    layers = np.memmap(
+        path,
+        dtype=dtype,
+        mode=mode,
+        offset=HEADER.size,
+        shape=(layer_count, height, width),
+    )
+    return MapFile(path, width, height, tile_size, layers)
+
+
+def load_tilemap(path: str, layer: int = 0, chunk_size: int = 32) -> TileMap:
+    """Open *path* copy-on-write and return *layer* as an editable TileMap."""
+    return open_map(path, mode="c").tilemap(layer, chunk_size)
+
+
+def save_map(
+    path: str,
+    layers: Union[np.ndarray, Sequence[np.ndarray]],
+    tile_size: int,
+) -> None:
+    """Write one or more equally sized 2D tile layers to *path*.
+
+    Layers are stored as uint8 when every tile id fits, uint16 otherwise.
+    """
+    stack = np.asarray(layers)
+    if stack.ndim == 2:
+        stack = stack[None]
+    if stack.ndim != 3:
+        raise ValueError("Layers must be 2D arrays of equal shape")
+    if stack.size and (stack.min() < 0 or stack.max() > 0xFFFF):
+        raise ValueError("Tile ids must be in range 0..65535")
+    itemsize = 1 if not stack.size or stack.max() <= 0xFF else 2
+    layer_count, height, width = stack.shape
+    with open(path, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, VERSION, itemsize, width, height, tile_size, layer_count))
+        fh.write(np.ascontiguousarray(stack, dtype=DTYPES[itemsize]).tobytes())
+
+
+def create_map(
+    path: str,
+    width: int,
+    height: int,
+    tile_size: int,
+    layer_count: int = 1,
+    itemsize: int = 1,
+) -> MapFile:
+    """Create a zero-filled map on disk and open it read-write.
+
+    The file is written sparsely and filled through the memory map, so maps
+    larger than RAM can be generated region by region.  *itemsize* is the
+    byte width of a tile id and must be 1 or 2.
+    """
+    if itemsize not in DTYPES:
+        raise ValueError(f"Unsupported itemsize {itemsize}; expected one of {sorted(DTYPES)}")
+    with open(path, "wb") as fh:
+        fh.write(HEADER.pack(MAGIC, VERSION, itemsize, width, height, tile_size, layer_count))
+        fh.truncate(HEADER.size + layer_count * width * height * itemsize)
+    return open_map(path, mode="r+")
+
+
+def convert_rows(rows: Sequence[Sequence[int]], path: str, tile_size: int) -> None:
+    """Convert a list-of-lists layout (like the old ``tile_arena.MAP``) to a file."""
+    save_map(path, np.array(rows, dtype=np.int64), tile_size)
+
+
+__all__ = [
+    "MapFile",
+    "read_header",
+    "open_map",
+    "load_tilemap",
+    "save_map",
+    "create_map",
+    "convert_rows",
+]
@@ -0,0 +1,134 @@
+"""Garbage-collector control and per-frame allocation tracking."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+_NO_PHASE = nullcontext()
+# Keep the tracer's own bookkeeping out of the numbers
+_FILTERS = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+
+
+class FrameMemoryManager:
+    """Keep garbage collection out of the frame's critical path.
+
+    * :meth:`scene_loaded` collects once and ``gc.freeze()``-s everything
+      that survived, so long-lived scene objects are never scanned again.
+    * While frames run, automatic collection is disabled.  :meth:`end_frame`
+      spends idle time left in the frame budget on young-generation
+      collections, escalating to older generations every few frames.  If
+      allocations pile up without idle time, a young collection is forced
+      anyway so memory stays bounded.
+    * With *sample_every* set, every n-th frame is traced with
+      ``tracemalloc`` and the allocations of each :meth:`phase` are
+      recorded (see :meth:`report`).
+    """
+
+    def __init__(
+        self,
+        idle_threshold: float = 0.002,
+        force_threshold: int = 20_000,
+        older_every: int = 10,
+        sample_every: Optional[int] = None,
+    ) -> None:
+        self.idle_threshold = idle_threshold
+        self.force_threshold = force_threshold
+        self.older_every = older_every
+        self.sample_every = sample_every
+        self.frame = 0
+        self.collections = [0, 0, 0]
+        self.phase_stats: Dict[str, List[int]] = {}
+        self.sampled_frames = 0
+        self._was_enabled = True
+        self._idle_runs = 0
+        self._sampling = False
+        self._started_tracing = False
+
+    # Lifecycle ---------------------------------------------------------
+    def start(self) -> None:
+        self._was_enabled = gc.isenabled()
+        gc.disable()
+        if self.sample_every and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        gc.unfreeze()
+        if self._was_enabled:
+            gc.enable()
+
+    def scene_loaded(self) -> None:
+        """Move every live object to the permanent generation."""
+        gc.collect()
+        gc.freeze()
+
+    # Per-frame hooks ---------------------------------------------------
+    def begin_frame(self) -> None:
+        self.frame += 1
+        self._sampling = bool(self.sample_every) and self.frame % self.sample_every == 0
+        if self._sampling:
+            self.sampled_frames += 1
+
+    def phase(self, name: str):
+        """Context manager attributing allocations inside it to *name*."""
+        if not self._sampling:
+            return _NO_PHASE
+        return self._traced_phase(name)
+
+    @contextmanager
+    def _traced_phase(self, name: str):
+        before = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+            blocks = size = 0
+            for stat in after.compare_to(before, "filename"):
+                if stat.count_diff > 0:
+                    blocks += stat.count_diff
+                if stat.size_diff > 0:
+                    size += stat.size_diff
+            totals = self.phase_stats.setdefault(name, [0, 0])
+            totals[0] += blocks
+            totals[1] += size
+
+    def end_frame(self, elapsed: float, budget: float) -> Optional[int]:
+        """Collect in the idle part of the frame.
+
+        *elapsed* is the time the frame's work took and *budget* the target
+        frame duration, both in seconds.  Returns the collected generation,
+        or ``None`` if no collection ran.
+        """
+        pending = gc.get_count()[0]
+        if budget - elapsed >= self.idle_threshold and pending:
+            self._idle_runs += 1
+            generation = 0
+            if self._idle_runs % (self.older_every ** 2) == 0:
+                generation = 2
+            elif self._idle_runs % self.older_every == 0:
+                generation = 1
+        elif pending >= self.force_threshold:
+            generation = 0
+        else:
+            return None
+        gc.collect(generation)
+        self.collections[generation] += 1
+        return generation
+
+    # Reporting ---------------------------------------------------------
+    def report(self) -> Dict[str, Tuple[float, float]]:
+        """Average ``(blocks, bytes)`` allocated per sampled frame, by phase."""
+        frames = self.sampled_frames or 1
+        return {
+            name: (blocks / frames, size / frames)
+            for name, (blocks, size) in self.phase_stats.items()
+        }
+
+
+__all__ = ["FrameMemoryManager"]
@@ -0,0 +1,115 @@
+"""Pooled particle system stored as a struct of NumPy arrays."""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pygame
+
+Color = Tuple[int, int, int]
+
+
+class ParticleSystem:
+    """Fixed-capacity pool of fading, growing circular particles.
+
+    Positions, velocities, timers and radii live in preallocated arrays and
+    are advanced in one vectorized step per tick.  Expired particles simply
+    free their slot for the next :meth:`emit`.  Drawing uses a cache of
+    pre-rendered circle sprites keyed by radius and alpha bucket, so no
+    surfaces are allocated per frame once the cache is warm.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 512,
+        lifetime: int = 30,
+        start_radius: float = 2.0,
+        growth: float = 0.3,
+        color: Color = (255, 255, 255),
+        alpha_buckets: int = 16,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self.start_radius = start_radius
+        self.growth = growth
+        self.color = color
+        self.alpha_buckets = alpha_buckets
+        self.rng = np.random.default_rng(seed)
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.timer = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._sprites: Dict[Tuple[int, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def emit(self, x: float, y: float, count: int = 10, speed: float = 2.0) -> int:
+        """Spawn up to *count* particles at ``(x, y)``.
+
+        Returns the number actually spawned; it is lower than *count* when
+        the pool is full.
+        """
+        slots = np.flatnonzero(~self.alive)[:count]
+        n = len(slots)
+        if n:
+            self.pos[slots] = (x, y)
+            self.vel[slots] = self.rng.uniform(-1, 1, (n, 2)) * speed
+            self.timer[slots] = self.lifetime
+            self.radius[slots] = self.start_radius
+            self.alive[slots] = True
+        return n
+
+    def update(self) -> None:
+        """Advance every live particle by one tick and retire expired ones."""
+        alive = self.alive
+        np.add(self.pos, self.vel, out=self.pos, where=alive[:, None])
+        np.subtract(self.timer, 1, out=self.timer, where=alive)
+        np.add(self.radius, self.growth, out=self.radius, where=alive)
+        alive &= self.timer > 0
+
+    def clear(self) -> None:
+        """Kill every particle."""
+        self.alive[:] = False
+
+    def _sprite(self, radius: int, bucket: int) -> pygame.Surface:
+        key = (radius, bucket)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            alpha = (bucket + 1) * 255 // self.alpha_buckets
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*self.color, alpha), (radius, radius), radius)
+            self._sprites[key] = sprite
+        return sprite
+
+    def snapshot(self) -> Tuple[Tuple[int, int, int, int], ...]:
+        """Return ``(radius, alpha_bucket, x, y)`` for every live particle.
+
+        The result is an immutable copy, so it can be handed to a render
+        thread while the simulation keeps updating the pool.
+        """
+        idx = np.flatnonzero(self.alive)
+        if not len(idx):
+            return ()
+        radii = np.maximum(1, self.radius[idx].astype(np.int32))
+        alpha = 255 * self.timer[idx] // self.lifetime
+        buckets = np.clip(alpha * self.alpha_buckets // 256, 0, self.alpha_buckets - 1)
+        corners = (self.pos[idx] - radii[:, None]).astype(np.int32)
+        return tuple(zip(radii.tolist(), buckets.tolist(), *corners.T.tolist()))
+
+    def draw(self, surface: pygame.Surface, snapshot: Optional[Tuple[Tuple[int, int, int, int], ...]] = None) -> None:
+        """Blit every live particle onto *surface* in a single batch.
+
+        *snapshot* is a result of :meth:`snapshot`; by default the live pool
+        is drawn.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        if not snapshot:
+            return
+        sprite = self._sprite
+        surface.blits([(sprite(r, b), (x, y)) for r, b, x, y in snapshot], doreturn=False)
@@ -0,0 +1,78 @@
+"""Pre-baked shaded tile surfaces."""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pygame
+
+Color = Tuple[int, int, int]
+
+# Surfaces are shared between callers, so they must be treated as read-only.
+_phong_cache: Dict[Tuple[Color, int, Tuple[float, float]], pygame.Surface] = {}
+
+
+def _light_key(light_dir) -> Tuple[float, float]:
+    lx, ly = float(light_dir[0]), float(light_dir[1])
+    length = math.hypot(lx, ly)
+    if not length:
+        raise ValueError("Light direction must be non-zero")
+    return (lx / length, ly / length)
+
+
+def _shade(color: Color, size: int, light: Tuple[float, float]) -> np.ndarray:
+    """Return a ``(size, size, 3)`` array with Phong-like shading of *color*.
+
+    The tile is brightest in the corner facing the light and falls off
+    along the light direction, with a tight specular highlight near the
+    lit corner.
+    """
+    # Shading is measured from the lit corner: along each axis the
+    # coordinate grows away from the light.  The axis weights are 1 for the
+    # default diagonal light, and the terms are evaluated in the same order
+    # as the original per-pixel loop so its output is reproduced exactly.
+    lx, ly = light
+    wx = round(math.sqrt(2) * abs(lx), 12)
+    wy = round(math.sqrt(2) * abs(ly), 12)
+    n = np.arange(size, dtype=np.float64) / size
+    nx = (n if lx <= 0 else n[::-1])[:, None]
+    ny = (n if ly <= 0 else n[::-1])[None, :]
+
+    diff = np.maximum(0.0, 1 - 0.7 * (wx * nx) - 0.7 * (wy * ny))
+    spec = np.maximum(0.0, 1 - wx * nx - wy * ny) ** 20
+    base = np.asarray(color[:3], dtype=np.float64)
+    rgb = base * (0.2 + 0.8 * diff)[..., None] + (255 * spec)[..., None]
+    return np.minimum(255, rgb.astype(np.int32)).astype(np.uint8)
+
+
+def phong_surface(color: Color, size: int, light_dir=(-1, -1)) -> pygame.Surface:
+    """Return a cached square surface shaded with a simple Phong model.
+
+    Surfaces are cached per ``(color, size, light_dir)`` so repeated calls
+    are free.  The returned surface is shared; copy it before drawing on it.
+    """
+    color = tuple(int(c) for c in color[:3])
+    light = _light_key(light_dir)
+    key = (color, size, light)
+    surf = _phong_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.surfarray.blit_array(surf, _shade(color, size, light))
+        alpha = pygame.surfarray.pixels_alpha(surf)
+        alpha[:] = 255
+        del alpha  # release the surface lock
+        _phong_cache[key] = surf
+    return surf
+
+
+def prebake_phong(colors: Iterable[Color], size: int, light_dir=(-1, -1)) -> None:
+    """Populate the cache for *colors* ahead of time, e.g. at load time."""
+    for color in colors:
+        phong_surface(color, size, light_dir)
+
+
+def clear_phong_cache() -> None:
+    """Drop every cached surface."""
+    _phong_cache.clear()
@@ -0,0 +1,134 @@
+"""Run the simulation on its own thread and hand immutable state to rendering."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Optional, Tuple
+
+from .scheduler import Scheduler
+
+
+class StateBuffer:
+    """Holds the most recently published simulation state.
+
+    Publishing replaces a single reference, which is atomic, so a reader
+    always gets a complete state without taking a lock.  States are
+    immutable snapshots rather than reused buffers: a published state must
+    not be mutated afterwards, because the render thread may still be
+    drawing it.
+    """
+
+    def __init__(self, initial: Any = None) -> None:
+        self._state = initial
+        self.version = 0
+        self._published = threading.Condition()
+
+    def publish(self, state: Any) -> None:
+        self._state = state
+        with self._published:
+            self.version += 1
+            self._published.notify_all()
+
+    def latest(self) -> Any:
+        """Most recently published state."""
+        return self._state
+
+    def wait(self, version: int, timeout: Optional[float] = None) -> bool:
+        """Block until a state newer than *version* is published."""
+        with self._published:
+            return self._published.wait_for(lambda: self.version > version, timeout)
+
+
+class SimulationThread:
+    """Drive a :class:`Scheduler` on a background thread.
+
+    Each pass runs the callables queued with :meth:`call_soon`, then every
+    due timer, and publishes ``snapshot()`` to :attr:`buffer` if anything
+    ran.  Between passes the thread sleeps until the next deadline or until
+    new work is queued.  The scheduler and the objects it updates belong to
+    this thread while it runs; other threads should only hand it work with
+    :meth:`call_soon` and read the published states.
+    """
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        snapshot: Callable[[], Any],
+        buffer: Optional[StateBuffer] = None,
+        max_sleep: float = 0.05,
+    ) -> None:
+        self.scheduler = scheduler
+        self.snapshot = snapshot
+        self.buffer = buffer if buffer is not None else StateBuffer()
+        self.max_sleep = max_sleep
+        self.error: Optional[BaseException] = None
+        self._calls: Deque[Tuple[Callable[..., Any], tuple]] = deque()
+        self._wake = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        self.buffer.publish(self.snapshot())
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the thread and re-raise any error it died with.
+
+        Callables queued with :meth:`call_soon` before this call still run.
+        """
+        self._running = False
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.check()
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        """Run ``callback(*args)`` on the simulation thread before the next tick."""
+        self._calls.append((callback, args))
+        self._wake.set()
+
+    def check(self) -> None:
+        """Raise if the simulation thread failed."""
+        if self.error is not None:
+            raise RuntimeError("Simulation thread failed") from self.error
+
+    def _run(self) -> None:
+        scheduler = self.scheduler
+        try:
+            while self._running:
+                self._wake.clear()
+                changed = self._run_calls()
+                if scheduler.run_due():
+                    changed = True
+                if changed:
+                    self.buffer.publish(self.snapshot())
+                deadline = scheduler.next_deadline()
+                timeout = self.max_sleep
+                if deadline is not None:
+                    timeout = min(timeout, deadline - scheduler.clock())
+                if timeout > 0:
+                    self._wake.wait(timeout)
+            if self._run_calls():
+                self.buffer.publish(self.snapshot())
+        except BaseException as exc:
+            self.error = exc
+            self._running = False
+
+    def _run_calls(self) -> bool:
+        calls = self._calls
+        ran = bool(calls)
+        while calls:
+            callback, args = calls.popleft()
+            callback(*args)
+        return ran
+
+
+__all__ = ["StateBuffer", "SimulationThread"]
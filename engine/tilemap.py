@@ -0,0 +1,179 @@
+"""Chunked tilemap with camera culling and cached chunk surfaces."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+from pygame import Rect
+
+
+class TileMap:
+    """Tile ids stored in a 2D NumPy array, indexed ``tiles[y, x]``.
+
+    The map is divided into square chunks of *chunk_size* tiles.  Every
+    chunk carries a version counter that is bumped whenever one of its tiles
+    changes, so renderers know exactly which cached chunks are stale.
+    """
+
+    def __init__(self, tiles: np.ndarray, tile_size: int, chunk_size: int = 32) -> None:
+        if tiles.ndim != 2:
+            raise ValueError("Tile array must be two-dimensional")
+        self.tiles = tiles
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.height, self.width = tiles.shape
+        self.chunks_x = -(-self.width // chunk_size)
+        self.chunks_y = -(-self.height // chunk_size)
+        self.chunk_versions = np.zeros((self.chunks_y, self.chunks_x), dtype=np.uint32)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[int]], tile_size: int, chunk_size: int = 32) -> "TileMap":
+        """Build a map from a list-of-lists layout."""
+        return cls(np.array(rows, dtype=np.uint8), tile_size, chunk_size)
+
+    @classmethod
+    def filled(cls, width: int, height: int, tile_size: int, value: int = 0, chunk_size: int = 32) -> "TileMap":
+        return cls(np.full((height, width), value, dtype=np.uint8), tile_size, chunk_size)
+
+    @property
+    def pixel_size(self) -> Tuple[int, int]:
+        return (self.width * self.tile_size, self.height * self.tile_size)
+
+    def get_tile(self, tx: int, ty: int) -> int:
+        return int(self.tiles[ty, tx])
+
+    def set_tile(self, tx: int, ty: int, value: int) -> None:
+        """Change a single tile and invalidate its chunk."""
+        self.tiles[ty, tx] = value
+        self.chunk_versions[ty // self.chunk_size, tx // self.chunk_size] += 1
+
+    def fill_rect(self, tx: int, ty: int, w: int, h: int, value: int) -> None:
+        """Fill a block of tiles and invalidate the affected chunks."""
+        self.tiles[ty:ty + h, tx:tx + w] = value
+        cs = self.chunk_size
+        self.chunk_versions[ty // cs:(ty + h - 1) // cs + 1, tx // cs:(tx + w - 1) // cs + 1] += 1
+
+
+class Camera:
+    """Viewport into the world, in pixels."""
+
+    def __init__(self, width: int, height: int, world_size: Tuple[int, int]) -> None:
+        self.rect = Rect(0, 0, width, height)
+        self.world_width, self.world_height = world_size
+
+    def follow(self, target: Rect) -> None:
+        """Centre the viewport on *target*, clamped to the world bounds."""
+        self.rect.center = target.center
+        self.rect.x = max(0, min(self.rect.x, self.world_width - self.rect.w))
+        self.rect.y = max(0, min(self.rect.y, self.world_height - self.rect.h))
+
+    def apply(self, rect: Rect) -> Rect:
+        """Return *rect* translated from world into screen coordinates."""
+        return rect.move(-self.rect.x, -self.rect.y)
+
+
+class ChunkRenderer:
+    """Draw a :class:`TileMap` through a :class:`Camera`.
+
+    Each chunk is pre-rendered to its own surface on first use and
+    re-rendered only after its tiles change.  Only chunks intersecting the
+    viewport are drawn, and the least recently drawn surfaces are evicted
+    beyond a limit, so per-frame cost and memory are bounded by the screen
+    size rather than the map size.
+
+    By default the limit follows the camera: every chunk a viewport of that
+    size can touch plus a one-chunk ring around it, e.g. 16 chunks (64 MB
+    of 1024x1024 surfaces) for a 640x480 view of 32x32-pixel tiles in
+    32-tile chunks.  *max_chunks* sets a fixed limit instead.  Tile ids
+    without an image are drawn with *default_tile*.
+    """
+
+    def __init__(
+        self,
+        tilemap: TileMap,
+        tile_images: Sequence[pygame.Surface],
+        max_chunks: Optional[int] = None,
+        default_tile: int = 0,
+    ) -> None:
+        self.tilemap = tilemap
+        self.tile_images = tile_images
+        self.max_chunks = max_chunks
+        self.default_tile = default_tile
+        self._view_limit: Optional[int] = None
+        self._view_size: Tuple[int, int] = (0, 0)
+        self.cache: "OrderedDict[Tuple[int, int], Tuple[int, pygame.Surface]]" = OrderedDict()
+
+    def _render_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        tm = self.tilemap
+        cs, ts = tm.chunk_size, tm.tile_size
+        block = tm.tiles[cy * cs:(cy + 1) * cs, cx * cs:(cx + 1) * cs]
+        surf = pygame.Surface((block.shape[1] * ts, block.shape[0] * ts))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        images = self.tile_images
+        for tile_id in np.unique(block).tolist():
+            image = images[tile_id] if tile_id < len(images) else images[self.default_tile]
+            ys, xs = np.nonzero(block == tile_id)
+            surf.blits([(image, (x * ts, y * ts)) for x, y in zip(xs.tolist(), ys.tolist())], doreturn=False)
+        return surf
+
+    def chunk_surface(self, cx: int, cy: int) -> pygame.Surface:
+        """Return the up-to-date surface of chunk ``(cx, cy)``."""
+        key = (cx, cy)
+        version = int(self.tilemap.chunk_versions[cy, cx])
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == version:
+            self.cache.move_to_end(key)
+            return cached[1]
+        surf = self._render_chunk(cx, cy)
+        self.cache[key] = (version, surf)
+        self.cache.move_to_end(key)
+        limit = self.chunk_limit
+        while limit is not None and len(self.cache) > limit:
+            self.cache.popitem(last=False)
+        return surf
+
+    @property
+    def chunk_limit(self) -> Optional[int]:
+        """Number of cached chunk surfaces kept (``None`` before the first draw)."""
+        return self.max_chunks if self.max_chunks is not None else self._view_limit
+
+    def view_limit(self, width: int, height: int) -> int:
+        """Chunks a *width* x *height* view can touch, plus a one-chunk ring."""
+        span = self.tilemap.chunk_size * self.tilemap.tile_size
+        # An unaligned view straddles one more chunk than it covers
+        across = -(-width // span) + 1 + 2
+        down = -(-height // span) + 1 + 2
+        return across * down
+
+    def visible_chunks(self, view: Rect):
+        """Yield ``(cx, cy)`` of chunks intersecting the world-space *view*."""
+        tm = self.tilemap
+        span = tm.chunk_size * tm.tile_size
+        x0 = max(0, view.left // span)
+        y0 = max(0, view.top // span)
+        x1 = min(tm.chunks_x - 1, (view.right - 1) // span)
+        y1 = min(tm.chunks_y - 1, (view.bottom - 1) // span)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                yield cx, cy
+
+    def draw(self, surface: pygame.Surface, camera: Camera) -> None:
+        if camera.rect.size != self._view_size:
+            self._view_size = camera.rect.size
+            self._view_limit = self.view_limit(*camera.rect.size)
+        span = self.tilemap.chunk_size * self.tilemap.tile_size
+        ox, oy = camera.rect.topleft
+        surface.blits(
+            [
+                (self.chunk_surface(cx, cy), (cx * span - ox, cy * span - oy))
+                for cx, cy in self.visible_chunks(camera.rect)
+            ],
+            doreturn=False,
+        )
+
+
+__all__ = ["TileMap", "Camera", "ChunkRenderer"]
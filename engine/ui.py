@@ -0,0 +1,114 @@
+"""HUD helpers: cached text rendering and full-screen overlays."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+Color = Tuple[int, int, int]
+
+
+class TextCache:
+    """Reuse fonts and rendered text surfaces between frames.
+
+    Fonts are loaded once per ``(face, size)``.  Rendered surfaces are kept
+    per ``(text, color, size, face)`` in an LRU of at most *max_entries*
+    items, so static menus and unchanged scores cost one dictionary lookup
+    per frame instead of a full render.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self.fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def font(self, size: int, face: Optional[str] = None) -> pygame.font.Font:
+        """Return the cached font for *face* (``None`` = default) at *size*."""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        return font
+
+    def render(
+        self, text: str, color: Color, size: int, face: Optional[str] = None
+    ) -> pygame.Surface:
+        """Return an antialiased surface with *text*, rendering it on a miss."""
+        key = (text, tuple(color), size, face)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            return surf
+        surf = self.font(size, face).render(text, True, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def draw(
+        self,
+        target: pygame.Surface,
+        text: str,
+        color: Color,
+        size: int,
+        center: Tuple[float, float],
+        face: Optional[str] = None,
+    ) -> pygame.Rect:
+        """Blit *text* centred at *center* on *target* and return its rect."""
+        surf = self.render(text, color, size, face)
+        return target.blit(surf, surf.get_rect(center=center))
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+
+
+class FadeOverlay:
+    """Full-screen solid colour overlay blended with a per-frame alpha.
+
+    The surface is allocated once; fading only changes its surface alpha.
+    """
+
+    def __init__(self, size: Tuple[int, int], color: Color) -> None:
+        self.surface = pygame.Surface(size)
+        self.surface.fill(color)
+
+    def draw(self, target: pygame.Surface, alpha: int) -> None:
+        if alpha <= 0:
+            return
+        self.surface.set_alpha(min(255, alpha))
+        target.blit(self.surface, (0, 0))
+
+
+class ScoreUI:
+    """Draw the current score and high score in the top-left corner."""
+
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        color: Color = (56, 74, 12),
+        size: int = 40,
+        cache: Optional[TextCache] = None,
+    ) -> None:
+        self.surface = surface
+        self.color = color
+        self.size = size
+        self.cache = cache or text_cache
+
+    def draw(self, surface: Optional[pygame.Surface], score: int, high_score: int) -> None:
+        target = surface or self.surface
+        score_surf = self.cache.render(f"Счёт: {score}", self.color, self.size)
+        high_surf = self.cache.render(f"Рекорд: {high_score}", self.color, self.size)
+        target.blit(score_surf, (20, 20))
+        target.blit(high_surf, (20, 20 + score_surf.get_height()))
+
+
+# Global text cache shared by HUD and menus
+text_cache = TextCache()
+
+
+__all__ = ["TextCache", "FadeOverlay", "ScoreUI", "text_cache"]
@@ -6,6 +6,9 @@ from typing import Iterable, Tuple
 
 Position = Tuple[int, int]
 
+# Random picks before falling back to a scan of the free cells
+RANDOM_TRIES = 100
+
 
 class Food:
     """Represents food that the snake can eat."""
@@ -17,9 +20,18 @@ class Food:
         self.spawn([])
 
     def spawn(self, occupied: Iterable[Position]) -> Position:
-        """Place the food at a random location not in *occupied*."""
-        while True:
+        """Place the food at a random location not in *occupied*.
+
+        If every cell is occupied the food stays where it is.
+        """
+        for _ in range(RANDOM_TRIES):
             pos = (random.randint(0, self.width - 1), random.randint(0, self.height - 1))
             if pos not in occupied:
                 self.position = pos
                 return pos
+        # Nearly full board: pick among the cells that are actually free
+        taken = set(occupied)
+        free = [(x, y) for x in range(self.width) for y in range(self.height) if (x, y) not in taken]
+        if free:
+            self.position = random.choice(free)
+        return self.position
@@ -0,0 +1,208 @@
+"""Persistent high scores backed by SQLite with batched background writes."""
+from __future__ import annotations
+
+import bisect
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .score import ScoreManager
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    seed INTEGER,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_games_score ON games (score DESC, finished_at);
+CREATE INDEX IF NOT EXISTS idx_games_player_score ON games (player, score DESC, finished_at);
+"""
+
+_COLUMNS = "player, score, level, duration, seed, finished_at"
+
+
+@dataclass(order=True, frozen=True)
+class GameResult:
+    """One finished game.  Ordering puts higher scores first, older first."""
+
+    sort_key: tuple = field(init=False, repr=False, compare=True)
+    player: str = field(compare=False)
+    score: int = field(compare=False)
+    level: int = field(compare=False)
+    duration: float = field(compare=False)
+    seed: Optional[int] = field(default=None, compare=False)
+    finished_at: float = field(default_factory=time.time, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sort_key", (-self.score, self.finished_at))
+
+    def row(self) -> tuple:
+        return (self.player, self.score, self.level, self.duration, self.seed, self.finished_at)
+
+
+_STOP = object()
+
+
+class LeaderboardStore:
+    """Record finished games and serve leaderboard queries.
+
+    :meth:`submit` never touches the database: results go onto a queue that
+    a background thread drains in batches of up to *batch_size* rows, one
+    transaction per batch, so ending a game never stalls a frame.  The best
+    *cache_size* results are kept in memory and served by :meth:`top`
+    without a query.  Other queries read from the database and see results
+    once they are flushed (see :meth:`flush`).  A batch that fails to write
+    is logged and dropped; the writer keeps running.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        cache_size: int = 10,
+    ) -> None:
+        if path == ":memory:":
+            # The writer thread would get its own private database
+            raise ValueError("LeaderboardStore needs a database file, not ':memory:'")
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache_size = cache_size
+        self._queue: "queue.Queue[object]" = queue.Queue()
+        self._cache_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._closed = False
+
+        self._reader = self._connect(check_same_thread=False)
+        self._reader.executescript(SCHEMA)
+        self._top: List[GameResult] = self._query(
+            f"SELECT {_COLUMNS} FROM games ORDER BY score DESC, finished_at LIMIT ?",
+            (cache_size,),
+        )
+
+        self._writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # Writing -----------------------------------------------------------
+    def submit(self, result: GameResult) -> None:
+        """Queue *result* for writing and update the in-memory top list.
+
+        Raises :class:`RuntimeError` once the store is closed.
+        """
+        with self._cache_lock:
+            if self._closed:
+                raise RuntimeError("LeaderboardStore is closed")
+            self._queue.put(result)
+            top = self._top
+            if len(top) < self.cache_size or result < top[-1]:
+                bisect.insort(top, result)
+                del top[self.cache_size:]
+
+    def attach(self, score: ScoreManager, player: str, seed: Optional[int] = None) -> None:
+        """Record a result every time *score* fires ``on_game_over``."""
+        started = [time.monotonic()]
+
+        def record() -> None:
+            now = time.monotonic()
+            self.submit(GameResult(player, score.final_score, score.final_level, now - started[0], seed))
+            started[0] = now
+
+        score.on_game_over.append(record)
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while item is not _STOP and len(batch) < self.batch_size:
+                    try:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                    batch.append(item)
+                results = [r for r in batch if r is not _STOP]
+                try:
+                    if results:
+                        with conn:
+                            conn.executemany(
+                                f"INSERT INTO games ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                                [r.row() for r in results],
+                            )
+                except Exception:
+                    log.exception("Dropped %d leaderboard results that could not be written", len(results))
+                finally:
+                    # flush() must not hang on a failed batch
+                    for _ in batch:
+                        self._queue.task_done()
+                if len(results) < len(batch):
+                    return
+        finally:
+            conn.close()
+
+    def flush(self) -> None:
+        """Block until every submitted result is written (or dropped on error)."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write pending results and stop the writer thread."""
+        with self._cache_lock:
+            self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._reader.close()
+
+    # Queries -----------------------------------------------------------
+    def _query(self, sql: str, params: tuple) -> List[GameResult]:
+        with self._read_lock:
+            rows = self._reader.execute(sql, params).fetchall()
+        return [GameResult(*row) for row in rows]
+
+    def top(self, n: int = 10) -> List[GameResult]:
+        """Best *n* results, from memory when *n* fits in the cache."""
+        if n <= self.cache_size:
+            with self._cache_lock:
+                return self._top[:n]
+        self.flush()
+        return self._query(
+            f"SELECT {_COLUMNS} FROM games ORDER BY score DESC, finished_at LIMIT ?", (n,)
+        )
+
+    def best_score(self) -> int:
+        with self._cache_lock:
+            return self._top[0].score if self._top else 0
+
+    def player_top(self, player: str, n: int = 10) -> List[GameResult]:
+        """Best *n* written results of *player*."""
+        return self._query(
+            f"SELECT {_COLUMNS} FROM games WHERE player = ? ORDER BY score DESC, finished_at LIMIT ?",
+            (player, n),
+        )
+
+    def __enter__(self) -> "LeaderboardStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+__all__ = ["GameResult", "LeaderboardStore"]
@@ -12,6 +12,9 @@ class ScoreManager:
     def __init__(self, level: Optional[Level] = None) -> None:
         self.score = 0
         self.level = level or Level()
+        # Result of the last finished game, readable from on_game_over
+        self.final_score = 0
+        self.final_level = 1
         self.on_food_eaten: List[Callable[[int], None]] = []
         self.on_game_over: List[Callable[[], None]] = []
 
@@ -24,6 +27,8 @@ class ScoreManager:
 
     def game_over(self) -> None:
         """Reset state and notify listeners of game over."""
+        self.final_score = self.score
+        self.final_level = self.level.level
         self.score = 0
         self.level.reset()
         for cb in list(self.on_game_over):
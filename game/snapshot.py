@@ -0,0 +1,330 @@
+"""Binary game-state snapshots and per-tick delta encoding.
+
+A full snapshot stores everything needed to resume a game: the snake body,
+direction and pending growth, the food position, score, level and the state
+of the random number generator.  Deltas only describe what changed since the
+previous tick; an ordinary move costs two bytes regardless of body length.
+Deltas carry the visible state only, so rewind should start from a full
+snapshot (a keyframe) and replay deltas from there.
+"""
+from __future__ import annotations
+
+import random
+import struct
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+from .food import Food
+from .score import ScoreManager
+from .snake import Snake
+
+Position = Tuple[int, int]
+
+MAGIC = b"SNAP"
+VERSION = 1
+
+# Unit steps encoded in two bits
+STEPS: List[Position] = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+STEP_CODES = {step: code for code, step in enumerate(STEPS)}
+
+_HEADER = struct.Struct("<4sBbbIhhIH")
+_CELL = struct.Struct("<hh")
+
+# Body encodings
+_BODY_RAW = 0
+_BODY_PACKED = 1
+
+# Delta flags
+STEP = 0x01
+BODY = 0x02
+FOOD = 0x04
+SCORE = 0x08
+LEVEL = 0x10
+DIRECTION = 0x20
+GROWTH = 0x40
+
+
+@dataclass(frozen=True)
+class GameState:
+    """Immutable copy of the complete state of one game."""
+
+    body: Tuple[Position, ...]
+    direction: Position
+    growth: int
+    food: Position
+    score: int
+    level: int
+    rng_state: Optional[tuple] = None
+
+
+def capture(snake: Snake, food: Food, score: ScoreManager, rng: Optional[random.Random] = None) -> GameState:
+    """Copy the current state out of the live game objects.
+
+    *rng* defaults to the module-level generator used by :class:`Food`.
+    """
+    return GameState(
+        body=tuple(snake.body),
+        direction=snake.direction,
+        growth=snake._growth,
+        food=food.position,
+        score=score.score,
+        level=score.level.level,
+        rng_state=(rng or random).getstate(),
+    )
+
+
+def restore(state: GameState, snake: Snake, food: Food, score: ScoreManager, rng: Optional[random.Random] = None) -> None:
+    """Write *state* back into the live game objects."""
+    snake.body = list(state.body)
+    snake.direction = state.direction
+    snake._growth = state.growth
+    food.position = state.food
+    score.score = state.score
+    score.level.level = state.level
+    if state.rng_state is not None:
+        (rng or random).setstate(state.rng_state)
+
+
+# Varints -------------------------------------------------------------------
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+# Body ----------------------------------------------------------------------
+def _encode_body(out: bytearray, body) -> None:
+    """Store the head and then one 2-bit step per segment when possible."""
+    _write_varint(out, len(body))
+    if not body:
+        out.append(_BODY_RAW)
+        return
+    codes = []
+    for (ax, ay), (bx, by) in zip(body, body[1:]):
+        code = STEP_CODES.get((bx - ax, by - ay))
+        if code is None:
+            break
+        codes.append(code)
+    if len(codes) == len(body) - 1:
+        out.append(_BODY_PACKED)
+        out += _CELL.pack(*body[0])
+        packed = bytearray((len(codes) + 3) // 4)
+        for i, code in enumerate(codes):
+            packed[i // 4] |= code << (2 * (i % 4))
+        out += packed
+    else:
+        out.append(_BODY_RAW)
+        for cell in body:
+            out += _CELL.pack(*cell)
+
+
+def _decode_body(data: bytes, offset: int) -> Tuple[Tuple[Position, ...], int]:
+    length, offset = _read_varint(data, offset)
+    kind = data[offset]
+    offset += 1
+    if not length:
+        return (), offset
+    if kind == _BODY_RAW:
+        body = [_CELL.unpack_from(data, offset + i * _CELL.size) for i in range(length)]
+        return tuple(body), offset + length * _CELL.size
+    x, y = _CELL.unpack_from(data, offset)
+    offset += _CELL.size
+    body = [(x, y)]
+    for i in range(length - 1):
+        dx, dy = STEPS[(data[offset + i // 4] >> (2 * (i % 4))) & 3]
+        x, y = x + dx, y + dy
+        body.append((x, y))
+    return tuple(body), offset + (length + 2) // 4
+
+
+# Full snapshots ------------------------------------------------------------
+def encode_snapshot(state: GameState) -> bytes:
+    """Serialise *state* into a self-contained binary snapshot."""
+    out = bytearray(
+        _HEADER.pack(
+            MAGIC, VERSION, state.direction[0], state.direction[1],
+            state.growth, state.food[0], state.food[1], state.score, state.level,
+        )
+    )
+    _encode_body(out, state.body)
+    if state.rng_state is None:
+        out.append(0)
+    else:
+        version, internal, gauss = state.rng_state
+        out.append(1)
+        out.append(version)
+        _write_varint(out, len(internal))
+        out += struct.pack(f"<{len(internal)}I", *internal)
+        if gauss is None:
+            out.append(0)
+        else:
+            out.append(1)
+            out += struct.pack("<d", gauss)
+    return bytes(out)
+
+
+def decode_snapshot(data: bytes) -> GameState:
+    """Inverse of :func:`encode_snapshot`."""
+    try:
+        magic, version, dx, dy, growth, fx, fy, score, level = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Unsupported or corrupt snapshot") from None
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Unsupported or corrupt snapshot")
+    try:
+        body, offset = _decode_body(data, _HEADER.size)
+        rng_state = None
+        has_rng = data[offset]
+        offset += 1
+        if has_rng:
+            rng_version = data[offset]
+            count, offset = _read_varint(data, offset + 1)
+            internal = struct.unpack_from(f"<{count}I", data, offset)
+            offset += 4 * count
+            has_gauss = data[offset]
+            offset += 1
+            gauss = None
+            if has_gauss:
+                gauss = struct.unpack_from("<d", data, offset)[0]
+                offset += 8
+            rng_state = (rng_version, internal, gauss)
+    except (IndexError, struct.error):
+        raise ValueError("Unsupported or corrupt snapshot") from None
+    # A cut inside the body can still parse, so the length must match exactly
+    if offset != len(data):
+        raise ValueError("Unsupported or corrupt snapshot")
+    return GameState(body, (dx, dy), growth, (fx, fy), score, level, rng_state)
+
+
+# Deltas --------------------------------------------------------------------
+class DeltaEncoder:
+    """Encode each new state as the difference from the previous one.
+
+    A normal move is stored as a single byte holding the step of the new
+    head and whether the tail was dropped.  Anything that cannot be
+    described that way (respawn, teleport, several moves at once) falls back
+    to sending the whole body.
+    """
+
+    def __init__(self, initial: GameState) -> None:
+        self.previous = initial
+
+    def encode(self, state: GameState) -> bytes:
+        prev = self.previous
+        flags = 0
+        out = bytearray(1)
+
+        step = self._step(prev.body, state.body)
+        if step is not None:
+            flags |= STEP
+            out.append(step)
+        elif state.body != prev.body:
+            flags |= BODY
+            _encode_body(out, state.body)
+        if state.food != prev.food:
+            flags |= FOOD
+            out += _CELL.pack(*state.food)
+        if state.score != prev.score:
+            flags |= SCORE
+            _write_varint(out, _zigzag(state.score - prev.score))
+        if state.level != prev.level:
+            flags |= LEVEL
+            _write_varint(out, _zigzag(state.level - prev.level))
+        if state.direction != prev.direction:
+            if state.direction not in STEP_CODES:
+                raise ValueError(f"Direction must be a unit step, got {state.direction}")
+            flags |= DIRECTION
+            out.append(STEP_CODES[state.direction])
+        if state.growth != prev.growth:
+            flags |= GROWTH
+            _write_varint(out, state.growth)
+
+        out[0] = flags
+        self.previous = state
+        return bytes(out)
+
+    @staticmethod
+    def _step(old, new) -> Optional[int]:
+        """Return the step byte if *new* is *old* advanced by one cell."""
+        if not old or not new:
+            return None
+        dropped = len(old) + 1 - len(new)
+        if dropped not in (0, 1):
+            return None
+        code = STEP_CODES.get((new[0][0] - old[0][0], new[0][1] - old[0][1]))
+        if code is None or new[1:] != old[:len(old) - dropped]:
+            return None
+        return code << 1 | dropped
+
+
+class DeltaDecoder:
+    """Rebuild states from a keyframe and a stream of deltas.
+
+    Decoded states have ``rng_state`` set to ``None`` because deltas do not
+    carry the generator state.
+    """
+
+    def __init__(self, initial: GameState) -> None:
+        self.state = initial
+
+    def apply(self, data: bytes) -> GameState:
+        state = self.state
+        flags = data[0]
+        offset = 1
+        changes = {}
+        if flags & STEP:
+            step = data[offset]
+            offset += 1
+            dx, dy = STEPS[step >> 1]
+            hx, hy = state.body[0]
+            body = state.body[:-1] if step & 1 else state.body
+            changes["body"] = ((hx + dx, hy + dy),) + body
+        elif flags & BODY:
+            changes["body"], offset = _decode_body(data, offset)
+        if flags & FOOD:
+            changes["food"] = _CELL.unpack_from(data, offset)
+            offset += _CELL.size
+        if flags & SCORE:
+            delta, offset = _read_varint(data, offset)
+            changes["score"] = state.score + _unzigzag(delta)
+        if flags & LEVEL:
+            delta, offset = _read_varint(data, offset)
+            changes["level"] = state.level + _unzigzag(delta)
+        if flags & DIRECTION:
+            changes["direction"] = STEPS[data[offset]]
+            offset += 1
+        if flags & GROWTH:
+            changes["growth"], offset = _read_varint(data, offset)
+        self.state = replace(state, rng_state=None, **changes)
+        return self.state
+
+
+__all__ = [
+    "GameState",
+    "capture",
+    "restore",
+    "encode_snapshot",
+    "decode_snapshot",
+    "DeltaEncoder",
+    "DeltaDecoder",
+]
@@ -0,0 +1,5 @@
+"""Headless multiplayer server built on the :mod:`game` package."""
+from .room import Room
+from .app import GameServer, StateDecoder
+
+__all__ = ["Room", "GameServer", "StateDecoder"]
@@ -0,0 +1,38 @@
+"""Run the multiplayer server: ``python -m server --port 8765``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from .app import GameServer
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Authoritative multiplayer snake server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tick-ms", type=float, default=100.0, help="Simulation tick interval")
+    parser.add_argument("--room-size", type=int, default=30, help="Width and height of each room in cells")
+    parser.add_argument("--max-players", type=int, default=4, help="Players per room")
+    parser.add_argument("--report-every", type=float, default=5.0, help="Seconds between stats lines")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    try:
+        server = GameServer(args.host, args.port, args.tick_ms / 1000, args.room_size, args.max_players)
+    except ValueError as exc:
+        sys.exit(str(exc))
+    try:
+        asyncio.run(server.serve_forever(args.report_every))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
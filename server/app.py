@@ -0,0 +1,293 @@
+"""Asyncio snake server hosting many rooms on one shared tick scheduler.
+
+Protocol: newline-delimited JSON over TCP.
+
+Client -> server::
+
+    {"join": "<room id>"}       first message, joins (or creates) a room
+    {"dir": [dx, dy]}           turn request
+
+Server -> client::
+
+    {"welcome": <player id>, "room": "<room id>", "players": {...}}
+    {"room": ..., "tick": n, "ts": <server monotonic time>, "players": {...}}
+
+``players`` maps each player id to ``{"snapshot": <base64>}``, a full
+:mod:`game.snapshot` keyframe, or ``{"delta": <base64>}``, the
+:class:`~game.snapshot.DeltaEncoder` change since the previous broadcast.
+The welcome carries keyframes of everyone already in the room, and a
+player's first broadcast after joining is a keyframe; an ordinary move
+then costs a few bytes.  Players missing from ``players`` have left.
+:class:`StateDecoder` rebuilds the states on the client side.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from game.snapshot import DeltaDecoder, DeltaEncoder, GameState, decode_snapshot, encode_snapshot
+
+from .room import MIN_ROOM_SIZE, Room
+
+log = logging.getLogger(__name__)
+
+# Drop clients whose socket buffer grows beyond this many bytes
+MAX_PENDING_BYTES = 256 * 1024
+# Drop clients that send a longer line than this
+MAX_LINE_BYTES = 64 * 1024
+
+
+def _parse_message(line: bytes) -> Optional[dict]:
+    """Decode one JSON line from a client; anything but an object is ``None``."""
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def _keyframe(state: GameState) -> dict:
+    return {"snapshot": base64.b64encode(encode_snapshot(state)).decode("ascii")}
+
+
+class StateDecoder:
+    """Client side of the broadcast protocol: track every player's state."""
+
+    def __init__(self) -> None:
+        self.players: Dict[str, DeltaDecoder] = {}
+
+    def apply(self, message: dict) -> Dict[str, GameState]:
+        """Fold a welcome or state message in and return the current states."""
+        players = message.get("players", {})
+        for player_id, entry in players.items():
+            if "snapshot" in entry:
+                state = decode_snapshot(base64.b64decode(entry["snapshot"]))
+                self.players[player_id] = DeltaDecoder(state)
+            else:
+                self.players[player_id].apply(base64.b64decode(entry["delta"]))
+        if "welcome" not in message:
+            for player_id in set(self.players) - set(players):
+                del self.players[player_id]
+        return {player_id: decoder.state for player_id, decoder in self.players.items()}
+
+
+@dataclass
+class TickStats:
+    """Scheduler timing over the current reporting window, in seconds."""
+
+    ticks: int = 0
+    busy_total: float = 0.0
+    busy_max: float = 0.0
+    late_total: float = 0.0
+    late_max: float = 0.0
+
+    def record(self, busy: float, late: float) -> None:
+        self.ticks += 1
+        self.busy_total += busy
+        self.busy_max = max(self.busy_max, busy)
+        self.late_total += late
+        self.late_max = max(self.late_max, late)
+
+    def summary(self) -> Dict[str, float]:
+        ticks = self.ticks or 1
+        return {
+            "ticks": self.ticks,
+            "busy_avg_ms": self.busy_total / ticks * 1000,
+            "busy_max_ms": self.busy_max * 1000,
+            "late_avg_ms": self.late_total / ticks * 1000,
+            "late_max_ms": self.late_max * 1000,
+        }
+
+
+@dataclass
+class Client:
+    player_id: int
+    room: Room
+    writer: asyncio.StreamWriter
+
+
+@dataclass
+class RoomSlot:
+    room: Room
+    clients: List[Client] = field(default_factory=list)
+    # One encoder per player, holding the state last broadcast
+    encoders: Dict[int, DeltaEncoder] = field(default_factory=dict)
+
+
+class GameServer:
+    """Accept clients, run every room on one tick loop and broadcast state."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        tick_interval: float = 0.1,
+        room_size: int = 30,
+        max_players: int = 4,
+        hello_timeout: float = 10.0,
+    ) -> None:
+        if room_size < MIN_ROOM_SIZE:
+            raise ValueError(f"room_size must be at least {MIN_ROOM_SIZE}, got {room_size}")
+        if not 0 < max_players < room_size:
+            raise ValueError(f"max_players must be between 1 and {room_size - 1}, got {max_players}")
+        self.host = host
+        self.port = port
+        self.tick_interval = tick_interval
+        self.room_size = room_size
+        self.max_players = max_players
+        self.hello_timeout = hello_timeout
+        self.rooms: Dict[str, RoomSlot] = {}
+        self.stats = TickStats()
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._ticker: Optional[asyncio.Task] = None
+
+    # Lifecycle ---------------------------------------------------------
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=MAX_LINE_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ticker = asyncio.create_task(self._tick_loop())
+        log.info("Listening on %s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        if self._ticker:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for slot in self.rooms.values():
+            for client in slot.clients:
+                client.writer.close()
+
+    async def serve_forever(self, report_every: float = 5.0) -> None:
+        await self.start()
+        try:
+            while True:
+                await asyncio.sleep(report_every)
+                players = sum(len(slot.clients) for slot in self.rooms.values())
+                log.info("rooms=%d players=%d %s", len(self.rooms), players, self.stats.summary())
+                self.stats = TickStats()
+        finally:
+            await self.stop()
+
+    # Connections -------------------------------------------------------
+    def _join(self, room_id: str, writer: asyncio.StreamWriter) -> Client:
+        slot = self.rooms.get(room_id)
+        if slot is None:
+            room = Room(room_id, self.room_size, self.room_size, self.max_players)
+            slot = self.rooms[room_id] = RoomSlot(room)
+        player_id = next(self._ids)
+        slot.room.add_player(player_id)
+        client = Client(player_id, slot.room, writer)
+        slot.clients.append(client)
+        return client
+
+    def _leave(self, client: Client) -> None:
+        slot = self.rooms.get(client.room.room_id)
+        if slot is None:
+            return
+        if client in slot.clients:
+            slot.clients.remove(client)
+        slot.room.remove_player(client.player_id)
+        slot.encoders.pop(client.player_id, None)
+        if not slot.clients:
+            del self.rooms[client.room.room_id]
+
+    def _welcome(self, client: Client) -> dict:
+        """Greeting with keyframes of the players already broadcast."""
+        encoders = self.rooms[client.room.room_id].encoders
+        keyframes = {str(player_id): _keyframe(encoder.previous) for player_id, encoder in encoders.items()}
+        return {"welcome": client.player_id, "room": client.room.room_id, "players": keyframes}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = None
+        try:
+            # A client that never says hello must not hold its socket open
+            hello = _parse_message(await asyncio.wait_for(reader.readline(), self.hello_timeout))
+            room_id = hello.get("join") if hello else None
+            if not isinstance(room_id, str) or not room_id:
+                return
+            try:
+                client = self._join(room_id, writer)
+            except ValueError as exc:
+                writer.write(json.dumps({"error": str(exc)}).encode() + b"\n")
+                return
+            writer.write(json.dumps(self._welcome(client)).encode() + b"\n")
+            async for line in reader:
+                message = _parse_message(line)
+                if message is None or "dir" not in message:
+                    continue
+                try:
+                    client.room.set_direction(client.player_id, message["dir"])
+                except (ValueError, TypeError):
+                    continue
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        except (ValueError, asyncio.LimitOverrunError):
+            # readline raises ValueError for a line over MAX_LINE_BYTES
+            log.info("Dropping client that sent a line over %d bytes", MAX_LINE_BYTES)
+        finally:
+            if client is not None:
+                self._leave(client)
+            writer.close()
+
+    # Simulation --------------------------------------------------------
+    def tick_rooms(self) -> None:
+        """Advance every room once and queue its state to its clients."""
+        now = time.monotonic()
+        for slot in list(self.rooms.values()):
+            try:
+                slot.room.tick()
+            except Exception:
+                # Drop the room so one broken room neither stops the ticker
+                # nor floods the log; its clients are disconnected
+                log.exception("Room %r failed to tick; closing it", slot.room.room_id)
+                del self.rooms[slot.room.room_id]
+                for client in slot.clients:
+                    client.writer.close()
+                continue
+            players = {}
+            for player_id, state in slot.room.player_states().items():
+                encoder = slot.encoders.get(player_id)
+                if encoder is None:
+                    slot.encoders[player_id] = DeltaEncoder(state)
+                    players[str(player_id)] = _keyframe(state)
+                else:
+                    players[str(player_id)] = {"delta": base64.b64encode(encoder.encode(state)).decode("ascii")}
+            message = {"room": slot.room.room_id, "tick": slot.room.tick_count, "ts": now, "players": players}
+            payload = json.dumps(message, separators=(",", ":")).encode() + b"\n"
+            for client in list(slot.clients):
+                transport = client.writer.transport
+                if transport.is_closing() or transport.get_write_buffer_size() > MAX_PENDING_BYTES:
+                    # Slow or gone: never let one client stall the room
+                    client.writer.close()
+                    continue
+                client.writer.write(payload)
+
+    async def _tick_loop(self) -> None:
+        """Tick all rooms on a fixed schedule of monotonic deadlines."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.tick_interval
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            started = loop.time()
+            late = started - deadline
+            self.tick_rooms()
+            self.stats.record(loop.time() - started, max(0.0, late))
+            if late > self.tick_interval:
+                # Too far behind: skip missed ticks instead of bursting
+                deadline = started
@@ -0,0 +1,124 @@
+"""Loopback load generator for the multiplayer server.
+
+Opens ``rooms * players`` bot connections, steers the snakes randomly and
+measures how quickly tick broadcasts arrive::
+
+    python -m server.loadgen --rooms 200 --players 4 --duration 30
+    python -m server.loadgen --spawn-server --rooms 500   # server in a child process
+
+Delivery latency is measured against the ``ts`` stamp the server puts on
+every state message; both sides read the same monotonic clock, so this only
+works when client and server run on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+@dataclass
+class BotStats:
+    messages: int = 0
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+
+async def run_bot(host: str, port: int, room: str, stats: BotStats, stop: asyncio.Event, turn_every: int) -> None:
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        stats.errors += 1
+        return
+    writer.write(json.dumps({"join": room}).encode() + b"\n")
+    rng = random.Random()
+    try:
+        while not stop.is_set():
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            if "ts" not in message:
+                if "error" in message:
+                    stats.errors += 1
+                    break
+                continue
+            stats.messages += 1
+            stats.latencies.append(time.monotonic() - message["ts"])
+            if message["tick"] % turn_every == 0:
+                writer.write(json.dumps({"dir": rng.choice(DIRECTIONS)}).encode() + b"\n")
+    except (ConnectionError, ValueError):
+        stats.errors += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, rooms: int, players: int, duration: float, turn_every: int) -> BotStats:
+    stats = BotStats()
+    stop = asyncio.Event()
+    bots = [
+        asyncio.create_task(run_bot(host, port, f"room-{r}", stats, stop, turn_every))
+        for r in range(rooms)
+        for _ in range(players)
+    ]
+    await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.wait(bots, timeout=5)
+    for bot in bots:
+        bot.cancel()
+    return stats
+
+
+def report(stats: BotStats, rooms: int, players: int, duration: float) -> None:
+    lat = sorted(stats.latencies) or [0.0]
+    pct = lambda q: lat[min(len(lat) - 1, int(q * len(lat)))] * 1000  # noqa: E731
+    print(f"rooms={rooms} players/room={players} connections={rooms * players} errors={stats.errors}")
+    print(f"state messages: {stats.messages} ({stats.messages / duration:.0f}/s)")
+    print(
+        f"tick->client latency ms: mean {statistics.fmean(lat) * 1000:.2f} "
+        f"p50 {pct(0.5):.2f} p99 {pct(0.99):.2f} max {lat[-1] * 1000:.2f}"
+    )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load generator for the snake server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--players", type=int, default=4, help="Bots per room")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--turn-every", type=int, default=3, help="Ticks between random turns")
+    parser.add_argument("--spawn-server", action="store_true", help="Start a server in a child process")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    server = None
+    if args.spawn_server:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "server", "--host", args.host, "--port", str(args.port),
+             "--max-players", str(args.players)]
+        )
+        time.sleep(1.0)
+    try:
+        stats = asyncio.run(run_load(args.host, args.port, args.rooms, args.players, args.duration, args.turn_every))
+        report(stats, args.rooms, args.players, args.duration)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Authoritative simulation of a single multiplayer room."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from game import Food, Level, ScoreManager, Snake
+from game.snapshot import GameState
+
+Position = Tuple[int, int]
+
+DIRECTIONS = {(1, 0), (-1, 0), (0, 1), (0, -1)}
+
+# Smallest field that fits the spawn positions with room to turn
+MIN_ROOM_SIZE = 8
+
+
+@dataclass
+class Player:
+    """A connected player and their snake."""
+
+    player_id: int
+    slot: int
+    snake: Snake
+    score: ScoreManager
+    pending: List[Position] = field(default_factory=list)
+    deaths: int = 0
+
+
+class Room:
+    """Runs one match: several snakes sharing a field and a food item.
+
+    The room is purely synchronous; the server calls :meth:`tick` at a fixed
+    rate and broadcasts :meth:`state` afterwards.  A snake that hits a wall,
+    itself or another snake loses its score and respawns.
+    """
+
+    def __init__(self, room_id: str, width: int = 30, height: int = 30, max_players: int = 4) -> None:
+        if width < MIN_ROOM_SIZE or height < MIN_ROOM_SIZE:
+            raise ValueError(f"Rooms must be at least {MIN_ROOM_SIZE}x{MIN_ROOM_SIZE} cells, got {width}x{height}")
+        if not 0 < max_players < height:
+            raise ValueError(f"A room {height} cells high fits 1 to {height - 1} players, got {max_players}")
+        self.room_id = room_id
+        self.width = width
+        self.height = height
+        self.max_players = max_players
+        self.players: Dict[int, Player] = {}
+        self.food = Food(width, height)
+        self.tick_count = 0
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    @property
+    def full(self) -> bool:
+        return len(self.players) >= self.max_players
+
+    def _spawn_snake(self, slot: int) -> Snake:
+        # Each slot starts on its own evenly spaced row
+        row = (slot + 1) * self.height // (self.max_players + 1)
+        return Snake(initial_length=3, start_pos=(3, row))
+
+    def add_player(self, player_id: int) -> Player:
+        if self.full:
+            raise ValueError(f"Room {self.room_id} is full")
+        taken = {p.slot for p in self.players.values()}
+        slot = min(set(range(self.max_players)) - taken)
+        player = Player(player_id, slot, self._spawn_snake(slot), ScoreManager(Level()))
+        self.players[player_id] = player
+        return player
+
+    def remove_player(self, player_id: int) -> None:
+        self.players.pop(player_id, None)
+
+    def set_direction(self, player_id: int, direction: Position) -> None:
+        """Queue a turn for *player_id*; invalid directions are ignored."""
+        player = self.players.get(player_id)
+        if player is None or not isinstance(direction, (list, tuple)) or len(direction) != 2:
+            return
+        if not all(type(v) is int for v in direction):
+            return
+        direction = tuple(direction)
+        if direction not in DIRECTIONS:
+            return
+        # Keep a short buffer so quick turns land on successive ticks
+        if len(player.pending) < 3:
+            player.pending.append(direction)
+
+    def _occupied(self) -> set:
+        return {cell for player in self.players.values() for cell in player.snake.body}
+
+    def _kill(self, player: Player) -> None:
+        player.deaths += 1
+        player.score.game_over()
+        player.pending.clear()
+        player.snake = self._spawn_snake(player.slot)
+
+    def tick(self) -> None:
+        """Advance the room by one simulation step."""
+        self.tick_count += 1
+        for player in self.players.values():
+            if player.pending:
+                player.snake.set_direction(player.pending.pop(0))
+            player.snake.move()
+
+        # Count body cells once to detect head-to-body and head-to-head hits
+        cells: Dict[Position, int] = {}
+        for player in self.players.values():
+            for cell in player.snake.body:
+                cells[cell] = cells.get(cell, 0) + 1
+
+        dead = []
+        for player in self.players.values():
+            snake = player.snake
+            if snake.check_wall_collision(self.width, self.height) or cells[snake.head()] > 1:
+                dead.append(player)
+                continue
+            if snake.head() == self.food.position:
+                snake.grow()
+                player.score.eat_food()
+                self.food.spawn(self._occupied())
+        for player in dead:
+            self._kill(player)
+
+    def player_states(self) -> Dict[int, GameState]:
+        """Each player's game as a :class:`GameState` for delta broadcasts.
+
+        The generator state is left out; clients never need it.
+        """
+        return {
+            p.player_id: GameState(
+                body=tuple(p.snake.body),
+                direction=p.snake.direction,
+                growth=p.snake._growth,
+                food=self.food.position,
+                score=p.score.score,
+                level=p.score.level.level,
+            )
+            for p in self.players.values()
+        }
+
+    def state(self) -> dict:
+        """JSON-serialisable snapshot broadcast to clients."""
+        return {
+            "room": self.room_id,
+            "tick": self.tick_count,
+            "food": self.food.position,
+            "players": {
+                str(p.player_id): {
+                    "body": p.snake.body,
+                    "score": p.score.score,
+                    "level": p.score.level.level,
+                }
+                for p in self.players.values()
+            },
+        }
@@ -5,3 +5,4 @@ WINDOW_HEIGHT = 600
 WINDOW_TITLE = "Game Window"
 FPS = 60
 ASSETS_DIR = "assets"
+SCORES_DB = "scores.db"
@@ -0,0 +1,170 @@
+"""Render recorded or scripted snake games to video without a window.
+
+A clip script is a JSON file with the random seed, the clip length in
+seconds and the key presses, each tied to the number of snake ticks that had
+passed when it was made::
+
+    {"seed": 7, "duration": 12, "inputs": [[0, "space"], [4, "down"], [9, "left"]]}
+
+``python snake_game.py --record clip.json`` writes such a file from a real
+game.  Clips are rendered under the SDL dummy driver on a virtual clock, so
+they run as fast as the machine allows and several clips can be rendered in
+parallel processes::
+
+    python snake_capture.py clip.json -o clip.mp4
+    python snake_capture.py clips/*.json --out-dir out --jobs 8
+    python snake_capture.py clip.json -o clip.raw     # raw frames, no ffmpeg
+
+Any output other than ``.raw`` is encoded by piping frames into ``ffmpeg``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@dataclass
+class ClipScript:
+    """Seed, length and tick-stamped key presses of one clip."""
+
+    seed: int
+    duration: float
+    inputs: List[Tuple[int, str]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, path: str) -> "ClipScript":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Stable sort by tick: presses within one tick keep their recorded order
+        inputs = sorted(((int(tick), str(key)) for tick, key in data.get("inputs", [])), key=lambda i: i[0])
+        return cls(int(data["seed"]), float(data["duration"]), inputs)
+
+
+@dataclass
+class ClipStats:
+    output: str
+    frames: int
+    seconds: float
+
+
+def render_clip(script: ClipScript, output: str, fps: float = 30, sink=None) -> ClipStats:
+    """Play *script* on a virtual clock and write every frame to *output*.
+
+    *sink* overrides the sink chosen from the output name.  The clip is
+    drawn on its own offscreen surface; the global random generator and the
+    audio setting are restored afterwards.
+    """
+    import numpy as np
+    import pygame
+
+    import snake_game
+    from engine import audio
+    from engine.capture import FrameCapture, open_sink
+
+    started = time.perf_counter()
+    surface = pygame.Surface((snake_game.SCREEN_SIZE, snake_game.SCREEN_SIZE), 0, 32)
+    capture = FrameCapture(surface)
+    if sink is None:
+        sink = open_sink(output, capture.size, fps, capture.pixel_format)
+    sound_enabled = audio.sound_enabled
+    rng_state = random.getstate()
+    try:
+        audio.set_enabled(False)
+        random.seed(script.seed)
+        now = [0.0]
+        game = snake_game.Main(clock=lambda: now[0], seed=script.seed, surface=surface)
+        game.particles.rng = np.random.default_rng(script.seed)
+
+        pending = list(reversed(script.inputs))
+        tick = game.tick_timer
+        update = tick.callback
+
+        def press(name: str) -> None:
+            key = pygame.key.key_code(name)
+            action = game.input.bindings.get(key)
+            if action is not None:
+                game.input.push_command(action)
+            else:
+                game.handle_key(key)
+
+        def scripted_update() -> None:
+            # Inputs made after n ticks are applied just before tick n + 1
+            while pending and pending[-1][0] < tick.fired:
+                press(pending.pop()[1])
+            update()
+
+        tick.callback = scripted_update
+        for frame in range(int(round(script.duration * fps))):
+            now[0] = frame / fps
+            game.scheduler.run_due()
+            snake_game.draw_frame(game)
+            capture.write(sink)
+    finally:
+        sink.close()
+        random.setstate(rng_state)
+        audio.set_enabled(sound_enabled)
+    return ClipStats(output, capture.frames, time.perf_counter() - started)
+
+
+def _render_job(job: Tuple[str, str, float]) -> ClipStats:
+    script_path, output, fps = job
+    return render_clip(ClipScript.load(script_path), output, fps)
+
+
+def render_clips(jobs: Sequence[Tuple[str, str]], fps: float = 30, workers: Optional[int] = None) -> List[ClipStats]:
+    """Render ``(script_path, output)`` pairs in a pool of worker processes."""
+    tasks = [(script, output, fps) for script, output in jobs]
+    if workers == 1 or len(tasks) == 1:
+        return [_render_job(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_job, tasks))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render snake clips offscreen")
+    parser.add_argument("scripts", nargs="+", help="Clip scripts (JSON)")
+    parser.add_argument("-o", "--output", help="Output file when rendering a single clip")
+    parser.add_argument("--out-dir", default=".", help="Directory for outputs of several clips")
+    parser.add_argument("--format", default="mp4", help="Extension for outputs in --out-dir (e.g. mp4, raw)")
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--jobs", type=int, default=None, help="Parallel processes (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    if args.output and len(args.scripts) > 1:
+        sys.exit("--output only works with a single script; use --out-dir")
+    if args.output:
+        jobs = [(args.scripts[0], args.output)]
+    else:
+        os.makedirs(args.out_dir, exist_ok=True)
+        jobs = [
+            (script, os.path.join(args.out_dir, f"{os.path.splitext(os.path.basename(script))[0]}.{args.format}"))
+            for script in args.scripts
+        ]
+    if any(not output.endswith(".raw") for _, output in jobs) and shutil.which("ffmpeg") is None:
+        sys.exit("ffmpeg not found; install it or write .raw outputs")
+    started = time.perf_counter()
+    results = render_clips(jobs, args.fps, args.jobs)
+    elapsed = time.perf_counter() - started
+    frames = sum(r.frames for r in results)
+    for r in results:
+        print(f"{r.output}: {r.frames} frames in {r.seconds:.2f}s ({r.frames / max(r.seconds, 1e-9):.0f} fps)")
+    print(f"total: {frames} frames in {elapsed:.2f}s, {frames / args.fps / max(elapsed, 1e-9):.1f}x real time")
+
+
+if __name__ == "__main__":
+    main()
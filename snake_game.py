@@ -1,15 +1,23 @@
+import json
 import pygame
 import random
 import sys
+import time
+from dataclasses import dataclass
 from pygame import Vector2
 
-puyuk9-codex
 from engine import audio
-
-from audio import audio
 from engine.input import InputHandler
-from engine.ui import ScoreUI
-main
+from engine.memory import FrameMemoryManager
+from engine.particles import ParticleSystem
+from engine.scheduler import Scheduler
+from engine.simulation import SimulationThread
+from engine.shading import phong_surface, prebake_phong
+from engine.ui import FadeOverlay, ScoreUI, text_cache
+from game import Level
+from game.leaderboard import GameResult, LeaderboardStore
+from game.snapshot import GameState
+from settings import SCORES_DB
 
 # Инициализация Pygame
 pygame.init()
@@ -25,6 +33,19 @@ SNAKE_COLOR = (83, 224, 73)
 FOOD_COLOR = (255, 0, 0)
 SCORE_COLOR = (56, 74, 12)
 
+# Темп игры: интервал хода змейки сокращается с каждым уровнем
+BASE_TICK = 0.150
+TICK_STEP = 0.015
+MIN_TICK = 0.060
+EFFECTS_TICK = 0.050
+# Вспышка и частицы задуманы в шагах по 150 мс; эффекты обновляются чаще,
+# поэтому их длительность и скорости пересчитаны под EFFECTS_TICK (4.5 с)
+EFFECTS_STEPS = round(BASE_TICK / EFFECTS_TICK)
+FLASH_STEPS = 30 * EFFECTS_STEPS
+PARTICLE_LIFETIME = 30 * EFFECTS_STEPS
+PARTICLE_GROWTH = 0.3 / EFFECTS_STEPS
+PARTICLE_SPEED = 2.0 / EFFECTS_STEPS
+
 # Настройка экрана
 screen = pygame.display.set_mode((SCREEN_SIZE, SCREEN_SIZE))
 pygame.display.set_caption('🐍 Змейка - 2D Игра')
@@ -38,19 +59,16 @@ shadow_surface.fill((0, 0, 0, 80))
 
 
 def create_phong_surface(color):
-    """Create a square surface with a simple Phong-like shading."""
-    surf = pygame.Surface((CELL_SIZE, CELL_SIZE), pygame.SRCALPHA)
-    for x in range(CELL_SIZE):
-        for y in range(CELL_SIZE):
-            nx = x / CELL_SIZE
-            ny = y / CELL_SIZE
-            diff = max(0, 1 - 0.7 * nx - 0.7 * ny)
-            spec = max(0, 1 - nx - ny) ** 20
-            r = min(255, int(color[0] * (0.2 + 0.8 * diff) + 255 * spec))
-            g = min(255, int(color[1] * (0.2 + 0.8 * diff) + 255 * spec))
-            b = min(255, int(color[2] * (0.2 + 0.8 * diff) + 255 * spec))
-            surf.set_at((x, y), (r, g, b))
-    return surf
+    """Return the cached Phong-shaded cell surface for *color*."""
+    return phong_surface(color, CELL_SIZE, LIGHT_DIR)
+
+
+prebake_phong((SNAKE_COLOR, FOOD_COLOR), CELL_SIZE, LIGHT_DIR)
+
+
+def tick_interval(level):
+    """Seconds between snake moves on *level*."""
+    return max(MIN_TICK, BASE_TICK - (level - 1) * TICK_STEP)
 
 class Snake:
     def __init__(self):
@@ -60,24 +78,22 @@ class Snake:
         # Pre-rendered segment surface with simple Phong shading
         self.segment_surface = create_phong_surface(SNAKE_COLOR)
 
-    def draw_snake(self):
-        for block in self.body:
-            x_pos = int(block.x * CELL_SIZE)
-            y_pos = int(block.y * CELL_SIZE)
+    def draw_snake(self, body=None, surface=None):
+        surface = screen if surface is None else surface
+        for x, y in self.body if body is None else body:
+            x_pos = int(x * CELL_SIZE)
+            y_pos = int(y * CELL_SIZE)
             block_rect = pygame.Rect(x_pos, y_pos, CELL_SIZE, CELL_SIZE)
-            screen.blit(shadow_surface, block_rect.move(SHADOW_OFFSET))
-            screen.blit(self.segment_surface, block_rect)
+            surface.blit(shadow_surface, block_rect.move(SHADOW_OFFSET))
+            surface.blit(self.segment_surface, block_rect)
     
     def move_snake(self):
+        # Update the body in place instead of copying the list every tick
+        self.body.insert(0, self.body[0] + self.direction)
         if self.new_block:
-            body_copy = self.body[:]
-            body_copy.insert(0, body_copy[0] + self.direction)
-            self.body = body_copy[:]
             self.new_block = False
         else:
-            body_copy = self.body[:-1]
-            body_copy.insert(0, body_copy[0] + self.direction)
-            self.body = body_copy[:]
+            self.body.pop()
     
     def add_block(self):
         self.new_block = True
@@ -91,10 +107,12 @@ class Food:
         self.surface = create_phong_surface(FOOD_COLOR)
         self.randomize()
 
-    def draw_food(self):
-        food_rect = pygame.Rect(int(self.pos.x * CELL_SIZE), int(self.pos.y * CELL_SIZE), CELL_SIZE, CELL_SIZE)
-        screen.blit(shadow_surface, food_rect.move(SHADOW_OFFSET))
-        screen.blit(self.surface, food_rect)
+    def draw_food(self, pos=None, surface=None):
+        surface = screen if surface is None else surface
+        x, y = self.pos if pos is None else pos
+        food_rect = pygame.Rect(int(x * CELL_SIZE), int(y * CELL_SIZE), CELL_SIZE, CELL_SIZE)
+        surface.blit(shadow_surface, food_rect.move(SHADOW_OFFSET))
+        surface.blit(self.surface, food_rect)
     
     def randomize(self):
         self.x = random.randint(0, CELL_NUMBER - 1)
@@ -102,80 +120,138 @@ class Food:
         self.pos = Vector2(self.x, self.y)
 
 
-class Particle:
-    """Simple particle used for food consumption effects."""
+@dataclass(frozen=True)
+class FrameState:
+    """Everything needed to draw one frame, copied out of :class:`Main`."""
+
+    body: tuple
+    food: tuple
+    score: int
+    high_score: int
+    flash_timer: int
+    game_active: bool
+    settings_active: bool
+    sound_enabled: bool
+    particles: tuple
 
-    def __init__(self, grid_pos: Vector2):
-        self.pos = Vector2(
-            grid_pos.x * CELL_SIZE + CELL_SIZE / 2,
-            grid_pos.y * CELL_SIZE + CELL_SIZE / 2,
-        )
-        self.velocity = Vector2(random.uniform(-1, 1), random.uniform(-1, 1)) * 2
-        self.timer = 30
-        self.radius = 2
-
-    def update(self) -> bool:
-        self.pos += self.velocity
-        self.timer -= 1
-        self.radius += 0.3
-        return self.timer <= 0
-
-    def draw(self, surface: pygame.Surface) -> None:
-        alpha = max(0, int(255 * (self.timer / 30)))
-        radius = max(1, int(self.radius))
-        particle_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(particle_surf, (255, 255, 255, alpha), (radius, radius), radius)
-        surface.blit(particle_surf, (int(self.pos.x - radius), int(self.pos.y - radius)))
 
 class Main:
-    def __init__(self):
+    def __init__(self, clock=time.perf_counter, records=None, seed=None, surface=None):
+        # Поверхность, на которую рисуется игра; по умолчанию окно
+        self.surface = screen if surface is None else surface
         self.snake = Snake()
         self.food = Food()
         self.score = 0
-        self.high_score = 0
+        # Рекорды хранятся в SQLite и записываются фоновым потоком;
+        # без хранилища (бенчмарки, рендер клипов) результаты не сохраняются
+        self.records = records
+        self.high_score = records.best_score() if records is not None else 0
+        # Зерно случайных чисел сохраняется вместе с результатом
+        self.seed = seed
+        self.started_at = time.monotonic()
         self.win_score = 10
         self.game_active = False
         self.settings_active = False
         self.sound_enabled = True
-puyuk9-codex
-        self.win_score = 10
 
-        self.particles = []
+        self.particles = ParticleSystem(capacity=512, lifetime=PARTICLE_LIFETIME, growth=PARTICLE_GROWTH)
         self.flash_timer = 0
+        self.level = Level(threshold=3)
+        self.level.on_level_up.append(self.on_level_up)
+        # Ходы змейки и эффекты выполняются по монотонным дедлайнам
+        self.scheduler = Scheduler(clock=clock)
+        self.tick_timer = self.scheduler.every(tick_interval(1), self.update)
+        self.scheduler.every(EFFECTS_TICK, self.update_effects)
         # Engine subsystems
         self.input = InputHandler()
-        self.ui = ScoreUI(screen)
-main
+        self.input.bind(pygame.K_UP, (0, -1))
+        self.input.bind(pygame.K_DOWN, (0, 1))
+        self.input.bind(pygame.K_LEFT, (-1, 0))
+        self.input.bind(pygame.K_RIGHT, (1, 0))
+        self.ui = ScoreUI(self.surface)
+        self.flash = FadeOverlay((SCREEN_SIZE, SCREEN_SIZE), (255, 0, 0))
 
         # load sound effects
         audio.load_effect('food', 'food.wav')
         audio.load_effect('game_over', 'game_over.wav')
         audio.load_effect('wall', 'wall.wav')
         audio.load_effect('victory', 'victory.wav')
-puyuk9-codex
-        
-
 
-main
     def update(self):
         if self.game_active:
+            self.apply_turn()
             self.snake.move_snake()
             self.check_collision()
             self.check_fail()
-        for p in self.particles[:]:
-            if p.update():
-                self.particles.remove(p)
+
+    def update_effects(self):
+        self.particles.update()
         if self.flash_timer > 0:
             self.flash_timer -= 1
     
-    def draw_elements(self):
+    def apply_turn(self):
+        """Apply the next buffered turn that is legal for the current direction."""
+        while True:
+            command = self.input.pop_command()
+            if command is None:
+                return
+            direction = Vector2(command.action)
+            if direction != self.snake.direction and direction != -self.snake.direction:
+                self.snake.direction = direction
+                return
+
+    def snapshot(self):
+        """Copy the drawable state so another thread can render it."""
+        return FrameState(
+            body=tuple((int(block.x), int(block.y)) for block in self.snake.body),
+            food=(int(self.food.pos.x), int(self.food.pos.y)),
+            score=self.score,
+            high_score=self.high_score,
+            flash_timer=self.flash_timer,
+            game_active=self.game_active,
+            settings_active=self.settings_active,
+            sound_enabled=self.sound_enabled,
+            particles=self.particles.snapshot(),
+        )
+
+    def save_state(self):
+        """Copy the game into a :class:`GameState` for ``game.snapshot``.
+
+        Only the simulation is saved: particles, the flash and the menu
+        state are visual and are not part of the snapshot.
+        """
+        return GameState(
+            body=tuple((int(block.x), int(block.y)) for block in self.snake.body),
+            direction=(int(self.snake.direction.x), int(self.snake.direction.y)),
+            growth=int(self.snake.new_block),
+            food=(int(self.food.pos.x), int(self.food.pos.y)),
+            score=self.score,
+            level=self.level.level,
+            rng_state=random.getstate(),
+        )
+
+    def load_state(self, state):
+        """Resume the simulation from a :class:`GameState`."""
+        self.snake.body = [Vector2(cell) for cell in state.body]
+        self.snake.direction = Vector2(state.direction)
+        self.snake.new_block = state.growth > 0
+        self.food.x, self.food.y = state.food
+        self.food.pos = Vector2(state.food)
+        self.score = state.score
+        self.high_score = max(self.high_score, state.score)
+        self.level.level = state.level
+        self.scheduler.set_interval(self.tick_timer, tick_interval(state.level))
+        if state.rng_state is not None:
+            random.setstate(state.rng_state)
+
+    def draw_elements(self, state=None):
+        state = state or self.snapshot()
         self.draw_grass()
-        self.food.draw_food()
-        self.snake.draw_snake()
-        for p in self.particles:
-            p.draw(screen)
-        self.draw_score()
-        self.draw_flash()
+        self.food.draw_food(state.food, self.surface)
+        self.snake.draw_snake(state.body, self.surface)
+        self.particles.draw(self.surface, state.particles)
+        self.draw_score(state)
+        self.draw_flash(state)
     
     def draw_grass(self):
         grass_color = (80, 120, 200)  # Более тёмный синий для узора
@@ -184,12 +260,12 @@ main
                 for col in range(CELL_NUMBER):
                     if col % 2 == 0:
                         grass_rect = pygame.Rect(col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                        pygame.draw.rect(screen, grass_color, grass_rect)
+                        pygame.draw.rect(self.surface, grass_color, grass_rect)
             else:
                 for col in range(CELL_NUMBER):
                     if col % 2 != 0:
                         grass_rect = pygame.Rect(col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                        pygame.draw.rect(screen, grass_color, grass_rect)
+                        pygame.draw.rect(self.surface, grass_color, grass_rect)
     
     def check_collision(self):
         if self.food.pos == self.snake.body[0]:
@@ -199,6 +275,7 @@ main
             self.score += 1
             if self.score > self.high_score:
                 self.high_score = self.score
+            self.level.update(self.score)
             self.on_food_eaten()
             if self.score == self.win_score:
                 self.on_victory()
@@ -228,29 +305,33 @@ main
                 self.game_over()
     
     def game_over(self):
+        self.record_result()
         self.game_active = False
-        self.flash_timer = 30
+        self.flash_timer = FLASH_STEPS
         self.snake.reset()
         self.food.randomize()
         self.score = 0
         self.on_game_over()
     
-    def draw_score(self):
-        self.ui.draw(screen, self.score, self.high_score)
+    def draw_score(self, state=None):
+        state = state or self
+        self.ui.draw(self.surface, state.score, state.high_score)
 
     def spawn_particles(self, pos: Vector2) -> None:
-        for _ in range(10):
-            self.particles.append(Particle(pos))
+        half = CELL_SIZE / 2
+        self.particles.emit(pos.x * CELL_SIZE + half, pos.y * CELL_SIZE + half, 10, PARTICLE_SPEED)
 
-    def draw_flash(self) -> None:
-        if self.flash_timer > 0:
-            alpha = int(255 * (self.flash_timer / 30))
-            flash = pygame.Surface((SCREEN_SIZE, SCREEN_SIZE), pygame.SRCALPHA)
-            flash.fill((255, 0, 0, alpha))
-            screen.blit(flash, (0, 0))
+    def draw_flash(self, state=None) -> None:
+        flash_timer = (state or self).flash_timer
+        if flash_timer > 0:
+            self.flash.draw(self.surface, int(255 * (flash_timer / FLASH_STEPS)))
 
     def start_game(self):
         self.game_active = True
+        self.started_at = time.monotonic()
+        self.level.reset()
+        self.scheduler.set_interval(self.tick_timer, tick_interval(1))
+        self.input.clear()
         if self.sound_enabled:
             audio.play_music('music.mp3')
 
@@ -260,21 +341,30 @@ main
         if self.sound_enabled and self.game_active:
             audio.play_music('music.mp3')
 
-    def draw_settings(self):
-        font = pygame.font.Font(None, 74)
-        title_surface = font.render('Настройки', True, SCORE_COLOR)
-        title_rect = title_surface.get_rect(center=(SCREEN_SIZE/2, SCREEN_SIZE/2 - 80))
-        screen.blit(title_surface, title_rect)
-
-        font = pygame.font.Font(None, 50)
-        sound_text = f'Звук: {"Вкл" if self.sound_enabled else "Выкл"}'
-        sound_surface = font.render(sound_text, True, SCORE_COLOR)
-        sound_rect = sound_surface.get_rect(center=(SCREEN_SIZE/2, SCREEN_SIZE/2))
-        screen.blit(sound_surface, sound_rect)
-
-        instruction_surface = font.render('Нажмите S для переключения', True, SCORE_COLOR)
-        instruction_rect = instruction_surface.get_rect(center=(SCREEN_SIZE/2, SCREEN_SIZE/2 + 60))
-        screen.blit(instruction_surface, instruction_rect)
+    def draw_settings(self, state=None):
+        center = SCREEN_SIZE / 2
+        text_cache.draw(self.surface, 'Настройки', SCORE_COLOR, 74, (center, center - 80))
+        sound_text = f'Звук: {"Вкл" if (state or self).sound_enabled else "Выкл"}'
+        text_cache.draw(self.surface, sound_text, SCORE_COLOR, 50, (center, center))
+        text_cache.draw(self.surface, 'Нажмите S для переключения', SCORE_COLOR, 50, (center, center + 60))
+
+    def draw_menu(self):
+        center = SCREEN_SIZE / 2
+        text_cache.draw(self.surface, '🐍 Змейка', SCORE_COLOR, 74, (center, center - 50))
+        text_cache.draw(self.surface, 'Нажмите ПРОБЕЛ для начала', SCORE_COLOR, 50, (center, center + 50))
+        text_cache.draw(self.surface, 'Нажмите N для настроек', SCORE_COLOR, 50, (center, center + 100))
+
+    def handle_key(self, key):
+        if self.settings_active:
+            if key == pygame.K_s:
+                self.toggle_sound()
+            if key == pygame.K_ESCAPE:
+                self.settings_active = False
+        else:
+            if key == pygame.K_SPACE and not self.game_active:
+                self.start_game()
+            elif key == pygame.K_n and not self.game_active:
+                self.settings_active = True
 
     def on_food_eaten(self):
         audio.play_effect('food')
@@ -282,7 +372,9 @@ main
     def on_game_over(self):
         audio.play_effect('game_over')
         audio.stop_music()
-puyuk9-codex
+
+    def on_level_up(self, level):
+        self.scheduler.set_interval(self.tick_timer, tick_interval(level))
 
     def on_wall_hit(self):
         audio.play_effect('wall')
@@ -290,65 +382,104 @@ puyuk9-codex
     def on_victory(self):
         audio.play_effect('victory')
         audio.stop_music()
+        self.record_result()
         self.game_active = False
 
-main
-
-# Создание экземпляра игры
-main_game = Main()
-
-# Создание события для обновления змейки
-SCREEN_UPDATE = pygame.USEREVENT
-pygame.time.set_timer(SCREEN_UPDATE, 150)
-
-# Основной игровой цикл
-while True:
-    for event in main_game.input.get_events():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == SCREEN_UPDATE:
-            main_game.update()
-        if event.type == pygame.KEYDOWN:
-            if main_game.settings_active:
-                if event.key == pygame.K_s:
-                    main_game.toggle_sound()
-                if event.key == pygame.K_ESCAPE:
-                    main_game.settings_active = False
-            else:
-                if event.key == pygame.K_SPACE and not main_game.game_active:
-                    main_game.start_game()
-                elif event.key == pygame.K_n and not main_game.game_active:
-                    main_game.settings_active = True
-                if main_game.game_active:
-                    if event.key == pygame.K_UP and main_game.snake.direction.y != 1:
-                        main_game.snake.direction = Vector2(0, -1)
-                    if event.key == pygame.K_DOWN and main_game.snake.direction.y != -1:
-                        main_game.snake.direction = Vector2(0, 1)
-                    if event.key == pygame.K_LEFT and main_game.snake.direction.x != 1:
-                        main_game.snake.direction = Vector2(-1, 0)
-                    if event.key == pygame.K_RIGHT and main_game.snake.direction.x != -1:
-                        main_game.snake.direction = Vector2(1, 0)
-    
-    screen.fill(BACKGROUND_COLOR)
-    main_game.draw_elements()
+    def record_result(self):
+        """Queue the finished game for the leaderboard without blocking."""
+        if self.records is None:
+            return
+        duration = time.monotonic() - self.started_at
+        self.records.submit(GameResult('player', self.score, self.level.level, duration, self.seed))
 
-    if not main_game.game_active:
-        if main_game.settings_active:
-            main_game.draw_settings()
+
+def draw_frame(main_game, state=None):
+    """Render one complete frame of *main_game* to its surface.
+
+    *state* is a :class:`FrameState` published by the simulation thread;
+    by default the current state of *main_game* is drawn.
+    """
+    state = state or main_game.snapshot()
+    main_game.surface.fill(BACKGROUND_COLOR)
+    main_game.draw_elements(state)
+
+    if not state.game_active:
+        if state.settings_active:
+            main_game.draw_settings(state)
+        else:
+            main_game.draw_menu()
+
+
+def save_recording(path, seed, duration, inputs):
+    """Write the inputs of a played game in the format of snake_capture.py."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"seed": seed, "duration": duration, "inputs": inputs}, f)
+
+
+def main(threaded=False, record=None):
+    # При записи фиксируем зерно случайных чисел, чтобы игру можно было
+    # воспроизвести в snake_capture.py
+    seed = random.randrange(2 ** 32)
+    random.seed(seed)
+    recording = []
+    recording_start = time.perf_counter()
+
+    # Создание экземпляра игры
+    records = LeaderboardStore(SCORES_DB)
+    main_game = Main(records=records, seed=seed)
+
+    # В потоковом режиме симуляция идёт в отдельном потоке, а главный поток
+    # рисует последний опубликованный снимок состояния
+    simulation = None
+    if threaded:
+        simulation = SimulationThread(main_game.scheduler, main_game.snapshot)
+        simulation.start()
+
+    # Сборщик мусора запускается только в свободное время кадра
+    memory = FrameMemoryManager()
+    memory.start()
+    memory.scene_loaded()
+    frame_budget = 1 / 60
+
+    # Основной игровой цикл
+    while True:
+        frame_start = time.perf_counter()
+        memory.begin_frame()
+        for event in main_game.input.get_events():
+            if event.type == pygame.QUIT:
+                if simulation:
+                    simulation.stop()
+                memory.stop()
+                records.close()
+                if record:
+                    save_recording(record, seed, time.perf_counter() - recording_start, recording)
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN:
+                if record:
+                    # Ходы привязаны к номеру тика, а не ко времени
+                    recording.append([main_game.tick_timer.fired, pygame.key.name(event.key)])
+                if simulation:
+                    simulation.call_soon(main_game.handle_key, event.key)
+                else:
+                    main_game.handle_key(event.key)
+
+        if simulation:
+            simulation.check()
+            draw_frame(main_game, simulation.buffer.latest())
         else:
-            font = pygame.font.Font(None, 74)
-            title_surface = font.render('🐍 Змейка', True, SCORE_COLOR)
-            title_rect = title_surface.get_rect(center=(SCREEN_SIZE/2, SCREEN_SIZE/2 - 50))
-            screen.blit(title_surface, title_rect)
-
-            font = pygame.font.Font(None, 50)
-            instruction_surface = font.render('Нажмите ПРОБЕЛ для начала', True, SCORE_COLOR)
-            instruction_rect = instruction_surface.get_rect(center=(SCREEN_SIZE/2, SCREEN_SIZE/2 + 50))
-            screen.blit(instruction_surface, instruction_rect)
-            settings_surface = font.render('Нажмите N для настроек', True, SCORE_COLOR)
-            settings_rect = settings_surface.get_rect(center=(SCREEN_SIZE/2, SCREEN_SIZE/2 + 100))
-            screen.blit(settings_surface, settings_rect)
-
-    pygame.display.update()
-    clock.tick(60)
+            main_game.scheduler.run_due()
+            draw_frame(main_game)
+        pygame.display.update()
+        memory.end_frame(time.perf_counter() - frame_start, frame_budget)
+        clock.tick(60)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Snake game")
+    parser.add_argument("--threaded", action="store_true", help="Run the simulation on its own thread")
+    parser.add_argument("--record", metavar="FILE", help="Save the inputs for snake_capture.py")
+    args = parser.parse_args()
+    main(threaded=args.threaded, record=args.record)
@@ -0,0 +1,71 @@
+import os
+import sys
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from benchmarks.harness import Result, compare, measure, read_results, write_results
+
+
+def _result(name, median):
+    return Result(name=name, loops=1, rounds=1, min=median, median=median, mean=median)
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance():
+    baseline = {"fast": _result("fast", 1.0), "slow": _result("slow", 1.0)}
+    current = [_result("fast", 1.2), _result("slow", 1.3), _result("new", 5.0)]
+
+    regressions = compare(current, baseline, tolerance=0.25)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert regressions[0].ratio == 1.3
+
+
+def test_results_round_trip_with_machine_tag(tmp_path):
+    path = str(tmp_path / "results.json")
+    result = measure("noop", lambda: None, rounds=2, min_time=0.001)
+
+    write_results(path, [result])
+
+    assert read_results(path) == {"noop": result}
+
+
+def test_snake_frame_benchmark_leaves_the_leaderboard_alone(tmp_path, monkeypatch):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from benchmarks import cases  # noqa: F401  (registers benchmarks)
+    from benchmarks.harness import BENCHMARKS
+
+    monkeypatch.chdir(tmp_path)
+    frame = BENCHMARKS["snake_game_frame"]()
+    frame()
+    import snake_game
+
+    game = snake_game.Main()
+    game.start_game()
+    game.game_over()
+
+    assert game.records is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_every_registered_benchmark_runs_once(tmp_path, monkeypatch):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from benchmarks import cases  # noqa: F401  (registers benchmarks)
+    from benchmarks.harness import BENCHMARKS
+
+    monkeypatch.chdir(tmp_path)
+    assert BENCHMARKS
+    for setup in BENCHMARKS.values():
+        setup()()
+
+
+def test_missing_baseline_fails_unless_allowed(tmp_path, capsys):
+    from benchmarks.__main__ import main
+
+    args = ["-k", "snake_move", "--rounds", "1", "--min-time", "0", "--output", str(tmp_path / "out.json"),
+            "--baseline", str(tmp_path / "missing.json")]
+
+    assert main(args) == 1
+    assert main(args + ["--allow-missing-baseline"]) == 0
@@ -0,0 +1,67 @@
+import os
+import sys
+
+from pygame import Rect
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.collision import TileCollider, merge_solid_tiles
+
+ARENA = [
+    [1, 1, 1, 1, 1],
+    [1, 0, 0, 0, 1],
+    [1, 0, 1, 0, 1],
+    [1, 0, 0, 0, 1],
+    [1, 1, 1, 1, 1],
+]
+
+
+def test_move_stops_at_wall_tiles():
+    collider = TileCollider(ARENA, 10)
+    rect = Rect(10, 10, 10, 10)
+
+    collider.move(rect, -4, 0)
+    assert rect.topleft == (10, 10)
+
+    collider.move(rect, 4, 0)
+    assert rect.topleft == (14, 10)
+
+    collider.move(rect, 0, 6)
+    # Overlaps the centre pillar column, so it is stopped above it
+    assert rect.topleft == (14, 10)
+
+
+def test_move_slides_along_walls():
+    collider = TileCollider(ARENA, 10)
+    rect = Rect(10, 10, 10, 10)
+
+    collider.move(rect, -5, 5)
+
+    assert rect.topleft == (10, 15)
+
+
+def test_solid_rects_only_returns_overlapped_tiles():
+    collider = TileCollider(ARENA, 10)
+    hits = collider.solid_rects(Rect(15, 15, 10, 10))
+
+    assert hits == [Rect(20, 20, 10, 10)]
+
+
+def test_merge_solid_tiles_covers_every_wall_with_fewer_rects():
+    rects = merge_solid_tiles(ARENA, 10)
+    solid = sum(row.count(1) for row in ARENA)
+
+    assert len(rects) < solid
+    assert sum(r.w * r.h for r in rects) == solid * 100
+    assert not any(a.colliderect(b) for i, a in enumerate(rects) for b in rects[i + 1:])
+
+
+def test_merge_solid_tiles_limited_to_a_region():
+    # The region reaches past the right edge and is clipped to the grid
+    rects = merge_solid_tiles(ARENA, 10, region=(2, 1, 9, 4))
+    bounds = Rect(20, 10, 30, 40)
+    solid = sum(ARENA[ty][tx] == 1 for ty in range(1, 5) for tx in range(2, 5))
+
+    assert all(bounds.contains(r) for r in rects)
+    assert sum(r.w * r.h for r in rects) == solid * 100
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import numpy as np
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.entities import EntityWorld
+
+
+def _brute_force_pairs(world):
+    pairs = set()
+    idx = np.flatnonzero(world.alive)
+    for n, i in enumerate(idx):
+        for j in idx[n + 1:]:
+            (xi, yi), (wi, hi) = world.pos[i], world.size[i]
+            (xj, yj), (wj, hj) = world.pos[j], world.size[j]
+            if xi < xj + wj and xj < xi + wi and yi < yj + hj and yj < yi + hi:
+                pairs.add((min(i, j), max(i, j)))
+    return pairs
+
+
+def test_overlapping_pairs_matches_brute_force():
+    rng = np.random.default_rng(3)
+    world = EntityWorld(400)
+    world.spawn(rng.uniform(0, 300, 300), rng.uniform(0, 300, 300), rng.uniform(1, 15, 300), rng.uniform(1, 15, 300))
+    world.despawn(range(0, 300, 7))
+
+    a, b = world.overlapping_pairs()
+
+    found = {(min(i, j), max(i, j)) for i, j in zip(a.tolist(), b.tolist())}
+    assert found == _brute_force_pairs(world)
+    assert len(found) == len(a)
+
+
+def test_update_stops_entities_at_solid_tiles():
+    tiles = np.zeros((4, 4), dtype=np.uint8)
+    tiles[:, 3] = 1  # wall column on the right
+    tiles[3, :] = 1  # wall row at the bottom
+    world = EntityWorld(2)
+    world.spawn([5, 12], [5, 5], 6, 6, [10, 0], [0, 10])
+
+    world.update(1.0, tiles, tile_size=10)
+
+    assert world.pos[0].tolist() == [15, 5]
+    assert world.pos[1].tolist() == [12, 15]
+    assert world.wall_hits[0].tolist() == [False, False]
+    assert world.wall_hits[1].tolist() == [False, False]
+
+    world.update(1.0, tiles, tile_size=10)
+
+    assert world.pos[0].tolist() == [24, 5]
+    assert world.pos[1].tolist() == [12, 24]
+    assert world.wall_hits[0].tolist() == [True, False]
+    assert world.wall_hits[1].tolist() == [False, True]
+
+
+def test_tiles_outside_the_grid_are_solid():
+    world = EntityWorld(1)
+    world.spawn(2, 2, 4, 4, -5, 0)
+
+    world.update(1.0, np.zeros((2, 2), dtype=np.uint8), tile_size=10)
+
+    assert world.pos[0].tolist() == [0, 2]
+    assert world.wall_hits[0, 0]
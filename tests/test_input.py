@@ -0,0 +1,111 @@
+import os
+import sys
+import pygame
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.input import InputHandler
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def _press(key):
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+
+def test_quick_turns_are_buffered_for_successive_ticks():
+    handler = InputHandler()
+    handler.bind(pygame.K_UP, "up")
+    handler.bind(pygame.K_LEFT, "left")
+
+    _press(pygame.K_UP)
+    _press(pygame.K_LEFT)
+    handler.get_events()
+
+    assert handler.pop_command().action == "up"
+    assert handler.pop_command().action == "left"
+    assert handler.pop_command() is None
+    assert len(handler.latencies) == 2
+
+
+def test_command_queue_is_bounded():
+    handler = InputHandler(max_commands=2)
+    for action in ("a", "b", "c"):
+        handler.push_command(action)
+
+    assert [c.action for c in handler.commands] == ["a", "b"]
+    assert handler.dropped == 1
+
+
+def test_filtered_events_do_not_reach_the_queue():
+    handler = InputHandler()
+    handler.install_filter()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0), rel=(0, 0), buttons=(0, 0, 0)))
+    _press(pygame.K_SPACE)
+
+    types = [event.type for event in handler.get_events()]
+    assert pygame.MOUSEMOTION not in types
+    assert pygame.KEYDOWN in types
+
+
+def test_commands_can_be_pushed_and_popped_from_different_threads():
+    import threading
+
+    handler = InputHandler(max_commands=2, allowed_events=None)
+    stop = threading.Event()
+    popped = []
+
+    def consume():
+        while not stop.is_set():
+            if handler.pop_command() is not None:
+                popped.append(1)
+            handler.clear()
+
+    # Switch threads as often as possible to expose check-then-act races
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    try:
+        for i in range(20000):
+            handler.push_command(i % 3)
+    finally:
+        stop.set()
+        consumer.join()
+        sys.setswitchinterval(interval)
+    assert len(handler.commands) <= 2
+
+
+def test_latency_stats_can_be_read_while_commands_are_consumed():
+    import threading
+
+    handler = InputHandler(max_commands=2, allowed_events=None, latency_window=8)
+    stop = threading.Event()
+
+    def consume():
+        while not stop.is_set():
+            handler.push_command(len(handler.latencies) % 2)
+            handler.pop_command()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    try:
+        # Iterating a deque while another thread appends to it can raise RuntimeError
+        for _ in range(20000):
+            assert handler.max_latency() >= 0.0
+            assert handler.average_latency() >= 0.0
+    finally:
+        stop.set()
+        consumer.join()
+        sys.setswitchinterval(interval)
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.leaderboard import GameResult, LeaderboardStore
+from game.level import Level
+from game.score import ScoreManager
+
+
+def test_results_are_batched_to_disk_and_ranked(tmp_path):
+    path = str(tmp_path / "scores.db")
+    with LeaderboardStore(path, batch_size=50, cache_size=3) as store:
+        for i in range(200):
+            store.submit(GameResult(f"bot{i % 4}", score=i % 37, level=1, duration=1.0, seed=i))
+
+        # Served from memory, before anything has to be written
+        assert [r.score for r in store.top(3)] == [36, 36, 36]
+
+        store.flush()
+        assert [r.score for r in store.top(5)] == [36, 36, 36, 36, 36]
+        assert [r.score for r in store.player_top("bot1", 2)] == [36, 35]
+
+    # A new store sees the persisted results and warms its cache from them
+    with LeaderboardStore(path, cache_size=3) as store:
+        assert store.best_score() == 36
+        assert len(store.top(1000)) == 200
+
+
+def test_game_over_event_records_final_score(tmp_path):
+    store = LeaderboardStore(str(tmp_path / "scores.db"))
+    score = ScoreManager(Level(threshold=2))
+    store.attach(score, player="alice", seed=99)
+
+    for _ in range(3):
+        score.eat_food()
+    score.game_over()
+    store.close()
+
+    with LeaderboardStore(str(tmp_path / "scores.db")) as reopened:
+        (result,) = reopened.player_top("alice")
+    assert (result.score, result.level, result.seed) == (3, 2, 99)
+    assert score.score == 0
+
+
+def test_in_memory_database_is_rejected():
+    with pytest.raises(ValueError):
+        LeaderboardStore(":memory:")
+
+
+def test_failed_write_is_logged_and_the_writer_keeps_going(tmp_path, caplog):
+    path = str(tmp_path / "scores.db")
+    with LeaderboardStore(path) as store:
+        # player is NOT NULL, so this insert fails inside the writer thread
+        store.submit(GameResult(None, score=5, level=1, duration=1.0))
+        store.flush()
+        assert "could not be written" in caplog.text
+
+        store.submit(GameResult("bob", score=2, level=1, duration=1.0, seed=7))
+        store.flush()
+        assert [(r.player, r.seed) for r in store.player_top("bob")] == [("bob", 7)]
+
+    with pytest.raises(RuntimeError):
+        store.submit(GameResult("late", score=1, level=1, duration=1.0))
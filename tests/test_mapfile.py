@@ -0,0 +1,76 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.mapfile import convert_rows, create_map, load_tilemap, open_map, read_header, save_map
+
+
+def test_list_layout_round_trips_with_one_byte_per_tile(tmp_path):
+    path = str(tmp_path / "arena.tmap")
+    rows = [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+
+    convert_rows(rows, path, tile_size=32)
+
+    width, height, tile_size, layers, dtype = read_header(path)
+    assert (width, height, tile_size, layers) == (3, 3, 32, 1)
+    assert dtype == np.uint8
+    assert os.path.getsize(path) == 32 + 9
+
+    tilemap = load_tilemap(path)
+    assert tilemap.tiles.tolist() == rows
+
+
+def test_large_tile_ids_use_uint16_layers(tmp_path):
+    path = str(tmp_path / "layers.tmap")
+    ground = np.zeros((4, 5), dtype=np.uint16)
+    decor = np.full((4, 5), 300, dtype=np.uint16)
+
+    save_map(path, [ground, decor], tile_size=16)
+
+    mapped = open_map(path)
+    assert mapped.layers.dtype == np.uint16
+    assert mapped.layer_count == 2
+    assert mapped.read_region(1, 1, 2, 2, layer=1).tolist() == [[300, 300], [300, 300]]
+
+
+def test_copy_on_write_edits_do_not_touch_the_file(tmp_path):
+    path = str(tmp_path / "cow.tmap")
+    save_map(path, np.zeros((2, 2), dtype=np.uint8), tile_size=8)
+
+    tilemap = load_tilemap(path)
+    tilemap.set_tile(0, 0, 1)
+
+    assert tilemap.get_tile(0, 0) == 1
+    assert open_map(path).layers[0, 0, 0] == 0
+
+
+def test_created_map_is_filled_region_by_region(tmp_path):
+    path = str(tmp_path / "big.tmap")
+    mapped = create_map(path, 64, 64, tile_size=32)
+    mapped.layers[0, :32, :32] = 1
+    mapped.layers.flush()
+
+    regions = {(x, y): int(tiles.max()) for x, y, tiles in open_map(path).iter_regions(32)}
+    assert regions == {(0, 0): 1, (32, 0): 0, (0, 32): 0, (32, 32): 0}
+
+
+def test_corrupt_header_is_rejected(tmp_path):
+    path = str(tmp_path / "bad.tmap")
+    with open(path, "wb") as fh:
+        fh.write(b"NOPE" + bytes(28))
+
+    with pytest.raises(ValueError):
+        open_map(path)
+
+
+def test_unsupported_itemsize_is_rejected_before_writing(tmp_path):
+    path = tmp_path / "wide.tmap"
+
+    with pytest.raises(ValueError):
+        create_map(str(path), 8, 8, 16, itemsize=4)
+    assert not path.exists()
@@ -0,0 +1,66 @@
+import gc
+import os
+import sys
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.loop import Game, Scene
+from engine.memory import FrameMemoryManager
+from engine.renderer import Renderer
+
+
+class _Input:
+    def get_events(self):
+        return []
+
+
+class _AllocatingScene(Scene):
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+        self.gc_enabled = []
+        self.garbage = []
+
+    def update(self, dt):
+        self.gc_enabled.append(gc.isenabled())
+        self.garbage = [[i] for i in range(1000)]
+        self.frames -= 1
+        if not self.frames:
+            self.game.stop()
+
+
+def test_collector_is_disabled_during_frames_and_restored():
+    memory = FrameMemoryManager()
+    scene = _AllocatingScene(frames=3)
+    Game(Renderer(), _Input(), scene, fps=1000, memory=memory).run()
+
+    assert scene.gc_enabled == [False, False, False]
+    assert gc.isenabled()
+    assert gc.get_freeze_count() == 0
+
+
+def test_idle_time_is_spent_on_collections():
+    memory = FrameMemoryManager(older_every=2)
+    memory.start()
+    try:
+        generations = []
+        keep = []
+        for _ in range(4):
+            memory.begin_frame()
+            keep.append([[i] for i in range(100)])
+            generations.append(memory.end_frame(elapsed=0.001, budget=1 / 60))
+    finally:
+        memory.stop()
+
+    assert generations == [0, 1, 0, 2]
+
+
+def test_sampled_frames_report_allocations_per_phase():
+    memory = FrameMemoryManager(sample_every=1)
+    scene = _AllocatingScene(frames=2)
+    Game(Renderer(), _Input(), scene, fps=1000, memory=memory).run()
+
+    report = memory.report()
+    assert set(report) == {"input", "update", "render"}
+    assert report["update"][0] > report["render"][0]
@@ -0,0 +1,54 @@
+import os
+import sys
+import pygame
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.particles import ParticleSystem
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def test_particles_expire_and_slots_are_reused():
+    particles = ParticleSystem(capacity=8, lifetime=3, seed=1)
+    assert particles.emit(10, 10, count=5) == 5
+    assert particles.emit(10, 10, count=5) == 3  # pool is full
+
+    for _ in range(3):
+        particles.update()
+    assert len(particles) == 0
+
+    assert particles.emit(0, 0, count=4) == 4
+    assert len(particles) == 4
+
+
+def test_update_moves_and_grows_live_particles():
+    particles = ParticleSystem(capacity=2, start_radius=2.0, growth=0.5, seed=1)
+    particles.emit(10, 10, count=1)
+    vx, vy = particles.vel[0]
+
+    particles.update()
+
+    assert particles.pos[0].tolist() == pytest.approx([10 + vx, 10 + vy])
+    assert particles.radius[0] == pytest.approx(2.5)
+    assert particles.timer[0] == particles.lifetime - 1
+
+
+def test_draw_reuses_cached_sprites():
+    particles = ParticleSystem(capacity=16, seed=1)
+    particles.emit(20, 20, count=16, speed=0)
+    surface = pygame.Surface((40, 40), pygame.SRCALPHA)
+
+    particles.draw(surface)
+
+    assert len(particles._sprites) == 1
+    assert surface.get_at((20, 20)).a > 0
@@ -0,0 +1,88 @@
+import os
+import sys
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.scheduler import Scheduler
+from game import Level
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeating_timer_does_not_drift_when_polled_late():
+    clock = _Clock()
+    scheduler = Scheduler(clock=clock)
+    fired = []
+    timer = scheduler.every(0.1, lambda: fired.append(clock.now))
+
+    # Poll every 0.07s: individual firings are late but the deadlines stay on the grid
+    for step in range(1, 144):
+        clock.now = step * 0.07
+        scheduler.run_due()
+    assert timer.fired == 100
+    assert abs(timer.deadline - 10.1) < 1e-9
+
+
+def test_after_fires_once_and_cancel_skips():
+    clock = _Clock()
+    scheduler = Scheduler(clock=clock)
+    fired = []
+    scheduler.after(0.5, lambda: fired.append("once"))
+    cancelled = scheduler.every(0.1, lambda: fired.append("cancelled"))
+    scheduler.cancel(cancelled)
+    assert len(scheduler) == 1
+
+    clock.now = 2.0
+    assert scheduler.run_due() == 1
+    assert fired == ["once"]
+    assert len(scheduler) == 0
+    assert scheduler.next_deadline() is None
+
+
+def test_catch_up_is_limited_after_a_stall():
+    clock = _Clock()
+    scheduler = Scheduler(clock=clock, max_catch_up=3)
+    timer = scheduler.every(0.1, lambda: None)
+
+    clock.now = 10.05
+    scheduler.run_due()
+    assert timer.fired == 1
+    # The phase is kept: the next deadline is on the original 0.1s grid
+    assert abs(timer.deadline - 10.1) < 1e-9
+
+
+def test_level_up_shortens_interval_from_last_tick():
+    clock = _Clock()
+    scheduler = Scheduler(clock=clock)
+    level = Level(threshold=1)
+    timer = scheduler.every(0.15, lambda: level.update(timer.fired))
+    level.on_level_up.append(lambda lvl: scheduler.set_interval(timer, 0.15 - 0.05 * (lvl - 1)))
+
+    clock.now = 0.15
+    scheduler.run_due()
+    assert level.level == 2
+    assert abs(timer.interval - 0.1) < 1e-9
+    assert abs(timer.deadline - 0.25) < 1e-9
+
+    clock.now = 0.25
+    assert scheduler.run_due() == 1
+    assert level.level == 3
+    assert abs(scheduler.next_deadline() - 0.30) < 1e-9
+
+
+def test_many_timers_fire_in_deadline_order():
+    clock = _Clock()
+    scheduler = Scheduler(clock=clock)
+    order = []
+    for i in range(5000, 0, -1):
+        scheduler.after(i / 1000, lambda i=i: order.append(i))
+    clock.now = 10.0
+    assert scheduler.run_due() == 5000
+    assert order == sorted(order)
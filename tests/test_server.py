@@ -0,0 +1,260 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from server import GameServer, Room
+
+
+def test_eating_food_grows_snake_and_scores():
+    room = Room("r", width=20, height=20)
+    player = room.add_player(1)
+    hx, hy = player.snake.head()
+    room.food.position = (hx + 1, hy)
+    length = len(player.snake.body)
+
+    room.tick()
+    room.tick()
+
+    assert player.score.score == 1
+    assert len(player.snake.body) == length + 1
+    assert room.food.position not in player.snake.body
+
+
+def test_wall_hit_resets_score_and_respawns():
+    room = Room("r", width=10, height=10)
+    player = room.add_player(1)
+    player.score.score = 3
+    room.set_direction(1, (0, -1))
+
+    # Starts on row 2, so the third step up leaves the field
+    for _ in range(3):
+        room.tick()
+
+    assert player.deaths == 1
+    assert player.score.score == 0
+    assert not player.snake.check_wall_collision(10, 10)
+
+
+def test_players_in_a_room_get_separate_start_rows():
+    room = Room("r", max_players=2)
+    first = room.add_player(7)
+    second = room.add_player(9)
+
+    assert first.snake.head() != second.snake.head()
+    assert room.full
+
+
+def test_clients_receive_state_broadcasts():
+    async def scenario():
+        server = GameServer(port=0, tick_interval=0.01)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b'{"join": "arena"}\n')
+            welcome = json.loads(await reader.readline())
+            writer.write(b'{"dir": [0, 1]}\n')
+            states = [json.loads(await reader.readline()) for _ in range(3)]
+            writer.close()
+            return welcome, states
+        finally:
+            await server.stop()
+
+    welcome, states = asyncio.run(scenario())
+
+    assert welcome["room"] == "arena"
+    player = str(welcome["welcome"])
+    assert all(player in state["players"] for state in states)
+    assert states[-1]["tick"] > states[0]["tick"]
+
+
+def test_malformed_directions_are_ignored():
+    room = Room("r", width=10, height=10)
+    player = room.add_player(1)
+    for bad in ([[1], [0]], "up", [1], [True, 0], [1.0, 0], {"x": 1}, None):
+        room.set_direction(1, bad)
+    assert player.pending == []
+
+
+def test_server_survives_bad_client_messages():
+    async def scenario():
+        server = GameServer(port=0, tick_interval=0.01)
+        await server.start()
+        try:
+            replies = []
+            for hello in (b"not json\n", b"[1, 2]\n", b'{"join": ["x"]}\n'):
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(hello)
+                replies.append(await reader.readline())
+                writer.close()
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b'{"join": "arena"}\n')
+            await reader.readline()
+            writer.write(b'{"dir": [[1], [0]]}\n[1, 2]\n{bad\n"dir"\n{"dir": [0, 1]}\n')
+            states = [json.loads(await reader.readline()) for _ in range(5)]
+            writer.close()
+            return replies, states
+        finally:
+            await server.stop()
+
+    replies, states = asyncio.run(scenario())
+
+    # A bad hello closes the connection like a missing "join"
+    assert replies == [b"", b"", b""]
+    assert states[-1]["tick"] > states[0]["tick"]
+
+
+def test_rooms_too_small_for_their_players_are_rejected():
+    from server.room import MIN_ROOM_SIZE
+
+    with pytest.raises(ValueError):
+        Room("r", width=MIN_ROOM_SIZE - 1, height=MIN_ROOM_SIZE - 1)
+    with pytest.raises(ValueError):
+        Room("r", width=MIN_ROOM_SIZE, height=MIN_ROOM_SIZE, max_players=MIN_ROOM_SIZE)
+    with pytest.raises(ValueError):
+        GameServer(room_size=2)
+
+
+def test_food_on_a_full_board_stays_put_and_finds_the_last_free_cell():
+    from game import Food
+
+    food = Food(4, 4)
+    cells = [(x, y) for x in range(4) for y in range(4)]
+    food.position = (1, 1)
+
+    assert food.spawn(cells) == (1, 1)
+    assert food.spawn([c for c in cells if c != (2, 3)]) == (2, 3)
+
+
+def test_a_failing_room_is_closed_without_stopping_the_others():
+    async def scenario():
+        server = GameServer(port=0, tick_interval=0.01)
+        await server.start()
+        try:
+            connections = {}
+            for room_id in ("broken", "fine"):
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(json.dumps({"join": room_id}).encode() + b"\n")
+                await reader.readline()
+                connections[room_id] = (reader, writer)
+
+            def explode():
+                raise RuntimeError("boom")
+
+            server.rooms["broken"].room.tick = explode
+            broken_reader = connections["broken"][0]
+            # The broken room's client is disconnected...
+            while await broken_reader.readline():
+                pass
+            # ...while the other room keeps ticking
+            fine_reader = connections["fine"][0]
+            states = [json.loads(await fine_reader.readline()) for _ in range(3)]
+            for _, writer in connections.values():
+                writer.close()
+            return states, set(server.rooms), server._ticker.done()
+        finally:
+            await server.stop()
+
+    states, rooms, ticker_done = asyncio.run(scenario())
+
+    assert states[-1]["tick"] > states[0]["tick"]
+    assert rooms == {"fine"}
+    assert not ticker_done
+
+
+def test_silent_and_flooding_clients_are_disconnected(caplog):
+    from server.app import MAX_LINE_BYTES
+
+    async def scenario():
+        server = GameServer(port=0, tick_interval=0.01, hello_timeout=0.05)
+        await server.start()
+        try:
+            # Never sends a hello
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            silent = await asyncio.wait_for(reader.read(), 2)
+            writer.close()
+
+            # Joins, then sends one endless line
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b'{"join": "arena"}\n')
+            await reader.readline()
+            writer.write(b"x" * (MAX_LINE_BYTES * 2) + b"\n")
+            await writer.drain()
+            while await asyncio.wait_for(reader.readline(), 2):
+                pass
+            writer.close()
+            return silent, set(server.rooms)
+        finally:
+            await server.stop()
+
+    with caplog.at_level("INFO", logger="server.app"):
+        silent, rooms = asyncio.run(scenario())
+
+    assert silent == b""
+    assert rooms == set()
+    assert "line over" in caplog.text
+
+
+class _Transport:
+    def is_closing(self):
+        return False
+
+    def get_write_buffer_size(self):
+        return 0
+
+
+class _Writer:
+    def __init__(self):
+        self.transport = _Transport()
+        self.messages = []
+
+    def write(self, data):
+        self.messages.extend(json.loads(line) for line in data.splitlines())
+
+    def close(self):
+        pass
+
+
+def test_delta_broadcasts_rebuild_every_players_state():
+    from server import StateDecoder
+
+    server = GameServer(tick_interval=0.01)
+    first = server._join("arena", _Writer())
+    decoders = {first.player_id: StateDecoder()}
+    decoders[first.player_id].apply(server._welcome(first))
+    room = first.room
+    for tick in range(12):
+        if tick == 4:
+            # A late joiner starts from the keyframes in its welcome
+            late = server._join("arena", _Writer())
+            decoders[late.player_id] = StateDecoder()
+            decoders[late.player_id].apply(server._welcome(late))
+        if tick == 6:
+            hx, hy = room.players[first.player_id].snake.head()
+            room.food.position = (hx, hy + 1)
+            room.set_direction(first.player_id, (0, 1))
+        if tick == 8:
+            room.set_direction(first.player_id, (1, 0))
+        server.tick_rooms()
+        expected = {str(pid): state for pid, state in room.player_states().items()}
+        for client in server.rooms["arena"].clients:
+            message = client.writer.messages[-1]
+            assert decoders[client.player_id].apply(message) == expected
+
+    # After the first keyframe an ordinary move is a tiny delta
+    room.food.position = (0, 0)
+    server.tick_rooms()
+    server.tick_rooms()
+    entry = server.rooms["arena"].clients[0].writer.messages[-1]["players"][str(first.player_id)]
+    assert set(entry) == {"delta"} and len(entry["delta"]) == 4
+
+    assert room.players[first.player_id].score.score == 1
+    server._leave(late)
+    server.tick_rooms()
+    assert set(decoders[first.player_id].apply(first.writer.messages[-1])) == {str(first.player_id)}
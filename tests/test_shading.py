@@ -0,0 +1,55 @@
+import os
+import sys
+import pygame
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.shading import phong_surface
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def test_phong_surface_is_cached_per_color_and_size():
+    a = phong_surface((255, 0, 0), 16)
+    assert phong_surface((255, 0, 0), 16) is a
+    assert phong_surface((255, 0, 0), 32) is not a
+    assert phong_surface((0, 255, 0), 16) is not a
+
+
+def test_phong_surface_is_lit_from_light_direction():
+    surf = phong_surface((83, 224, 73), 40, (-1, -1))
+    assert surf.get_at((0, 0)) == pygame.Color(255, 255, 255, 255)
+    assert surf.get_at((39, 39)) == pygame.Color(16, 44, 14, 255)
+
+    flipped = phong_surface((83, 224, 73), 40, (1, 1))
+    assert flipped.get_at((39, 39)) == pygame.Color(255, 255, 255, 255)
+
+
+def _reference_phong(color, size):
+    """The original per-pixel loop from snake_game.create_phong_surface."""
+    pixels = {}
+    for x in range(size):
+        for y in range(size):
+            nx = x / size
+            ny = y / size
+            diff = max(0, 1 - 0.7 * nx - 0.7 * ny)
+            spec = max(0, 1 - nx - ny) ** 20
+            pixels[x, y] = tuple(min(255, int(c * (0.2 + 0.8 * diff) + 255 * spec)) for c in color)
+    return pixels
+
+
+@pytest.mark.parametrize("size", [7, 16, 33, 40, 64])
+@pytest.mark.parametrize("color", [(83, 224, 73), (255, 0, 0), (13, 77, 201), (128, 128, 128)])
+def test_phong_surface_matches_the_per_pixel_loop(color, size):
+    surf = phong_surface(color, size, (-1, -1))
+    for (x, y), rgb in _reference_phong(color, size).items():
+        assert tuple(surf.get_at((x, y)))[:3] == rgb, (x, y)
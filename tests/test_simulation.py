@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.loop import Game, Scene
+from engine.renderer import Renderer
+from engine.scheduler import Scheduler
+from engine.simulation import SimulationThread, StateBuffer
+
+
+class _Input:
+    def get_events(self):
+        return ["tick"]
+
+
+def test_state_buffer_serves_the_latest_state():
+    buffer = StateBuffer(initial="a")
+    assert buffer.latest() == "a"
+    buffer.publish("b")
+    buffer.publish("c")
+    assert buffer.latest() == "c"
+    assert buffer.version == 2
+    assert buffer.wait(1, timeout=0)
+    assert not buffer.wait(2, timeout=0.01)
+
+
+def test_simulation_thread_ticks_and_publishes():
+    scheduler = Scheduler()
+    counter = {"ticks": 0}
+    threads = set()
+
+    def tick():
+        counter["ticks"] += 1
+        threads.add(threading.current_thread().name)
+
+    scheduler.every(0.002, tick)
+    sim = SimulationThread(scheduler, lambda: counter["ticks"])
+    sim.start()
+    assert sim.buffer.wait(5, timeout=2)
+    sim.call_soon(threads.add, "call_soon")
+    sim.stop()
+
+    assert threads == {"simulation", "call_soon"}
+    assert sim.buffer.latest() == counter["ticks"]
+    assert not sim.running
+
+
+def test_simulation_thread_errors_are_raised_on_stop():
+    scheduler = Scheduler()
+    sim = SimulationThread(scheduler, lambda: None)
+    sim.start()
+    sim.call_soon(lambda: 1 / 0)
+    with pytest.raises(RuntimeError) as info:
+        for _ in range(200):
+            sim.check()
+            threading.Event().wait(0.005)
+        sim.stop()
+    assert isinstance(info.value.__cause__, ZeroDivisionError)
+
+
+class _CountingScene(Scene):
+    def __init__(self, ticks):
+        super().__init__()
+        self.ticks = ticks
+        self.updates = 0
+        self.inputs = 0
+        self.update_threads = set()
+        self.rendered = []
+
+    def handle_input(self, events):
+        self.inputs += len(events)
+
+    def update(self, dt):
+        self.updates += 1
+        self.update_threads.add(threading.current_thread().name)
+        if self.updates >= self.ticks:
+            self.game.stop()
+
+    def snapshot(self):
+        return self.updates
+
+    def render_state(self, renderer, state):
+        self.rendered.append(state)
+
+
+def test_game_threaded_mode_renders_published_snapshots():
+    scene = _CountingScene(ticks=20)
+    game = Game(Renderer(), _Input(), scene, fps=200, tick_rate=400)
+    game.run()
+
+    assert scene.updates >= 20
+    assert scene.update_threads == {"simulation"}
+    assert scene.inputs > 0
+    assert scene.rendered and scene.rendered == sorted(scene.rendered)
+    assert game.simulation is None
+    assert len(game.scheduler) == 0
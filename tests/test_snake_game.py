@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pygame
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.snapshot import decode_snapshot, encode_snapshot
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def _play(game, ticks):
+    for _ in range(ticks):
+        game.update()
+    return game.save_state()
+
+
+def test_saved_game_resumes_identically():
+    import snake_game
+
+    game = snake_game.Main(clock=lambda: 0.0)
+    game.start_game()
+    game.food.pos = game.snake.body[0] + game.snake.direction
+    _play(game, 3)
+    game.input.push_command((0, 1))
+    _play(game, 1)
+
+    saved = encode_snapshot(game.save_state())
+    expected = _play(game, 12)
+
+    resumed = snake_game.Main(clock=lambda: 0.0)
+    resumed.start_game()
+    resumed.load_state(decode_snapshot(saved))
+
+    assert resumed.score == 1
+    assert _play(resumed, 12) == expected
+
+
+class _Records:
+    def __init__(self):
+        self.results = []
+
+    def best_score(self):
+        return 0
+
+    def submit(self, result):
+        self.results.append(result)
+
+
+def test_finished_game_is_recorded_with_its_seed():
+    import snake_game
+
+    records = _Records()
+    game = snake_game.Main(clock=lambda: 0.0, records=records, seed=1234)
+    game.start_game()
+    game.score = 4
+    game.game_over()
+
+    (result,) = records.results
+    assert (result.score, result.seed) == (4, 1234)
+
+
+def test_flash_and_particles_last_as_long_as_with_150ms_ticks():
+    import snake_game
+
+    now = [0.0]
+    game = snake_game.Main(clock=lambda: now[0])
+    game.spawn_particles(game.food.pos)
+    game.game_over()
+
+    def advance_to(seconds):
+        while now[0] < seconds - 1e-9:
+            now[0] += snake_game.EFFECTS_TICK / 2
+            game.scheduler.run_due()
+
+    advance_to(4.4)
+    assert game.flash_timer > 0 and len(game.particles)
+    advance_to(4.6)
+    assert game.flash_timer == 0 and not len(game.particles)
@@ -0,0 +1,98 @@
+import os
+import random
+import sys
+from dataclasses import replace
+
+import pytest
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from game.food import Food
+from game.level import Level
+from game.score import ScoreManager
+from game.snake import Snake
+from game.snapshot import (
+    DeltaDecoder,
+    DeltaEncoder,
+    capture,
+    decode_snapshot,
+    encode_snapshot,
+    restore,
+)
+
+
+def _game():
+    snake = Snake(initial_length=5, start_pos=(10, 10))
+    food = Food(20, 20)
+    score = ScoreManager(Level(threshold=2))
+    return snake, food, score
+
+
+def test_snapshot_round_trip_restores_game_and_rng():
+    random.seed(42)
+    snake, food, score = _game()
+    snake.grow(2)
+    score.eat_food()
+    state = capture(snake, food, score)
+
+    data = encode_snapshot(state)
+    expected_spawn = food.spawn(snake.body)
+
+    other_snake, other_food, other_score = _game()
+    restore(decode_snapshot(data), other_snake, other_food, other_score)
+
+    assert capture(other_snake, other_food, other_score) == state
+    assert other_food.spawn(other_snake.body) == expected_spawn
+
+
+def test_long_body_is_packed_two_bits_per_segment():
+    snake = Snake(initial_length=1000, start_pos=(500, 0))
+    state = capture(snake, Food(10, 10), ScoreManager())
+
+    data = encode_snapshot(replace(state, rng_state=None))
+
+    assert len(data) < 300
+    assert decode_snapshot(data).body == state.body
+
+
+def test_deltas_are_a_few_bytes_and_replay_exactly():
+    random.seed(7)
+    snake, food, score = _game()
+    keyframe = capture(snake, food, score)
+    encoder = DeltaEncoder(keyframe)
+    decoder = DeltaDecoder(keyframe)
+
+    turns = {3: (0, 1), 6: (-1, 0), 9: (0, 1)}
+    for tick in range(12):
+        if tick in turns:
+            snake.set_direction(turns[tick])
+        snake.move()
+        if tick == 4:
+            snake.grow()
+            score.eat_food()
+            food.spawn(snake.body)
+        if tick == 10:
+            # Respawn: the body jumps, so the delta falls back to a full body
+            snake = Snake(initial_length=3, start_pos=(2, 2))
+        state = capture(snake, food, score)
+        delta = encoder.encode(state)
+        if tick not in (4, 5, 10) and tick not in turns:
+            assert len(delta) == 2
+        decoded = decoder.apply(delta)
+        assert decoded == replace(state, rng_state=None)
+
+
+def test_corrupt_snapshot_is_rejected():
+    with pytest.raises(ValueError):
+        decode_snapshot(b"nope")
+
+    random.seed(1)
+    snake, food, score = _game()
+    for state in (capture(snake, food, score), replace(capture(snake, food, score), rng_state=None)):
+        data = encode_snapshot(state)
+        for cut in {30, 40, len(data) - 10, len(data) - 1} & set(range(len(data))):
+            with pytest.raises(ValueError):
+                decode_snapshot(data[:cut])
+        with pytest.raises(ValueError):
+            decode_snapshot(data + b"\x00")
@@ -0,0 +1,110 @@
+import os
+import sys
+
+import numpy as np
+import pygame
+import pytest
+from pygame import Rect
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.tilemap import Camera, ChunkRenderer, TileMap
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def _tiles(size=4):
+    floor = pygame.Surface((size, size))
+    floor.fill((0, 0, 0))
+    wall = pygame.Surface((size, size))
+    wall.fill((255, 255, 255))
+    return [floor, wall]
+
+
+def test_only_visible_chunks_are_rendered():
+    tilemap = TileMap.filled(1000, 1000, 4, chunk_size=16)
+    renderer = ChunkRenderer(tilemap, _tiles())
+    camera = Camera(100, 100, tilemap.pixel_size)
+    screen = pygame.Surface((100, 100))
+
+    renderer.draw(screen, camera)
+
+    # 100 px view over 64 px chunks touches at most 2x2 chunks
+    assert len(renderer.cache) == 4
+
+
+def test_edited_chunk_is_rerendered():
+    tilemap = TileMap.filled(64, 64, 4, chunk_size=16)
+    renderer = ChunkRenderer(tilemap, _tiles())
+    before = renderer.chunk_surface(0, 0)
+    other = renderer.chunk_surface(1, 0)
+
+    tilemap.set_tile(1, 1, 1)
+
+    after = renderer.chunk_surface(0, 0)
+    assert after is not before
+    assert after.get_at((5, 5)) == pygame.Color(255, 255, 255)
+    assert renderer.chunk_surface(1, 0) is other
+
+
+def test_chunk_cache_is_bounded():
+    tilemap = TileMap.filled(64, 64, 4, chunk_size=16)
+    renderer = ChunkRenderer(tilemap, _tiles(), max_chunks=2)
+    for cx in range(4):
+        renderer.chunk_surface(cx, 0)
+
+    assert list(renderer.cache) == [(2, 0), (3, 0)]
+
+
+def test_camera_follow_is_clamped_to_world():
+    camera = Camera(100, 100, (400, 400))
+
+    camera.follow(Rect(0, 0, 10, 10))
+    assert camera.rect.topleft == (0, 0)
+
+    camera.follow(Rect(395, 395, 10, 10))
+    assert camera.rect.topleft == (300, 300)
+
+    camera.follow(Rect(200, 200, 10, 10))
+    assert camera.apply(Rect(200, 200, 10, 10)).topleft == (45, 45)
+
+
+def test_from_rows_uses_compact_array():
+    tilemap = TileMap.from_rows([[1, 1], [0, 1]], 8)
+    assert tilemap.tiles.dtype == np.uint8
+    assert tilemap.get_tile(0, 1) == 0
+
+
+def test_default_cache_limit_follows_the_viewport():
+    tilemap = TileMap.filled(1000, 1000, 4, chunk_size=16)
+    renderer = ChunkRenderer(tilemap, _tiles())
+    camera = Camera(100, 100, tilemap.pixel_size)
+    screen = pygame.Surface((100, 100))
+
+    # Scroll diagonally across the whole map
+    for step in range(0, 3000, 50):
+        camera.rect.topleft = (step, step)
+        renderer.draw(screen, camera)
+
+    # 100 px over 64 px chunks: up to 3x3 visible plus a one-chunk ring
+    assert renderer.chunk_limit == 25
+    assert len(renderer.cache) <= 25
+
+
+def test_unknown_tile_ids_use_the_default_image():
+    tilemap = TileMap.filled(16, 16, 4, chunk_size=16)
+    tilemap.set_tile(2, 2, 7)
+    renderer = ChunkRenderer(tilemap, _tiles(), default_tile=1)
+
+    surf = renderer.chunk_surface(0, 0)
+
+    assert surf.get_at((9, 9)) == pygame.Color(255, 255, 255)
+    assert surf.get_at((1, 1)) == pygame.Color(0, 0, 0)
@@ -0,0 +1,40 @@
+import os
+import sys
+import pygame
+import pytest
+
+# Ensure project root on path
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from engine.ui import TextCache
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _pygame_setup():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+def test_fonts_and_rendered_text_are_reused():
+    cache = TextCache()
+    first = cache.render("Score: 1", (255, 255, 255), 30)
+
+    assert cache.render("Score: 1", (255, 255, 255), 30) is first
+    assert cache.render("Score: 2", (255, 255, 255), 30) is not first
+    assert len(cache.fonts) == 1
+
+
+def test_least_recently_used_text_is_evicted():
+    cache = TextCache(max_entries=2)
+    a = cache.render("a", (0, 0, 0), 20)
+    cache.render("b", (0, 0, 0), 20)
+    cache.render("a", (0, 0, 0), 20)  # refresh "a"
+    cache.render("c", (0, 0, 0), 20)
+
+    keys = [key[0] for key in cache.surfaces]
+    assert keys == ["a", "c"]
+    assert cache.render("a", (0, 0, 0), 20) is a
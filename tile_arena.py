@@ -1,16 +1,38 @@
+import sys
+
+import numpy as np
 import pygame
 from pygame import Rect
 
+from engine.collision import TileCollider, merge_solid_tiles
+from engine.entities import EntityWorld
+from engine.mapfile import load_tilemap
+from engine.tilemap import Camera, ChunkRenderer, TileMap
+
 # Initialize Pygame
 pygame.init()
 
 TILE_SIZE = 32
-MAP_WIDTH = 20
-MAP_HEIGHT = 15
-SCREEN = pygame.display.set_mode((MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE))
+MAP_WIDTH = 256
+MAP_HEIGHT = 256
+SCREEN_WIDTH = 20 * TILE_SIZE
+SCREEN_HEIGHT = 15 * TILE_SIZE
+SCREEN = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Tile Arena Demo")
 CLOCK = pygame.time.Clock()
 
+# Map layout (0=floor, 1=wall).  A map file can be passed on the command
+# line; otherwise border walls with a grid of pillars are generated.
+if len(sys.argv) > 1:
+    tilemap = load_tilemap(sys.argv[1])
+    TILE_SIZE = tilemap.tile_size
+else:
+    tilemap = TileMap.filled(MAP_WIDTH, MAP_HEIGHT, TILE_SIZE)
+    tilemap.tiles[[0, -1], :] = 1
+    tilemap.tiles[:, [0, -1]] = 1
+    tilemap.tiles[4::8, 4::8] = 1
+MAP = tilemap.tiles
+
 # Generate tile surfaces instead of loading textures
 FLOOR_IMG = pygame.Surface((TILE_SIZE, TILE_SIZE))
 FLOOR_IMG.fill((170, 170, 170))
@@ -19,32 +41,11 @@ WALL_IMG = pygame.Surface((TILE_SIZE, TILE_SIZE))
 WALL_IMG.fill((100, 100, 100))
 WALL_IMG = WALL_IMG.convert()
 
-# Simple map layout (0=floor, 1=wall)
-MAP = [
-    [1]*MAP_WIDTH,
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1] + [0]*(MAP_WIDTH-2) + [1],
-    [1]*MAP_WIDTH,
-]
-
-# Precompute wall rectangles for collision
-walls = []
-for y, row in enumerate(MAP):
-    for x, cell in enumerate(row):
-        if cell == 1:
-            rect = Rect(x*TILE_SIZE, y*TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            walls.append(rect)
+renderer = ChunkRenderer(tilemap, [FLOOR_IMG, WALL_IMG])
+camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, tilemap.pixel_size)
+
+# Grid lookup for movement
+collider = TileCollider(MAP, TILE_SIZE)
 
 class Player:
     def __init__(self):
@@ -53,35 +54,81 @@ class Player:
         self.speed = 4
 
     def move(self, dx, dy):
-        # Attempt horizontal move
-        if dx:
-            self.rect.x += dx
-            for wall in walls:
-                if self.rect.colliderect(wall):
-                    if dx > 0:
-                        self.rect.right = wall.left
-                    else:
-                        self.rect.left = wall.right
-        # Attempt vertical move
-        if dy:
-            self.rect.y += dy
-            for wall in walls:
-                if self.rect.colliderect(wall):
-                    if dy > 0:
-                        self.rect.bottom = wall.top
-                    else:
-                        self.rect.top = wall.bottom
+        collider.move(self.rect, dx, dy)
 
     def draw(self, surf):
-        pygame.draw.rect(surf, self.color, self.rect)
+        pygame.draw.rect(surf, self.color, camera.apply(self.rect))
 
 player = Player()
 
+# Wandering agents that bounce off walls and each other
+AGENT_COUNT = 2000
+AGENT_SIZE = 12
+AGENT_COLOR = (50, 90, 200)
+rng = np.random.default_rng()
+
+# Rejection-sample floor tiles: memory stays proportional to AGENT_COUNT
+# rather than to the map, which may be a huge memory-mapped file
+spot_x, spot_y = [], []
+placed = rounds = 0
+while placed < AGENT_COUNT:
+    rounds += 1
+    if rounds > 1000:
+        sys.exit("Could not find enough floor tiles for the agents")
+    tx = rng.integers(0, MAP.shape[1], AGENT_COUNT)
+    ty = rng.integers(0, MAP.shape[0], AGENT_COUNT)
+    floor = MAP[ty, tx] == 0
+    spot_x.append(tx[floor])
+    spot_y.append(ty[floor])
+    placed += int(floor.sum())
+spot_x = np.concatenate(spot_x)[:AGENT_COUNT]
+spot_y = np.concatenate(spot_y)[:AGENT_COUNT]
+agents = EntityWorld(AGENT_COUNT)
+agents.spawn(
+    spot_x * TILE_SIZE + (TILE_SIZE - AGENT_SIZE) / 2,
+    spot_y * TILE_SIZE + (TILE_SIZE - AGENT_SIZE) / 2,
+    AGENT_SIZE,
+    AGENT_SIZE,
+    rng.uniform(-2, 2, AGENT_COUNT),
+    rng.uniform(-2, 2, AGENT_COUNT),
+)
+
+
+def update_agents():
+    agents.update(1.0, MAP, TILE_SIZE)
+    agents.vel[agents.wall_hits] *= -1
+    a, b = agents.overlapping_pairs()
+    agents.vel[np.concatenate((a, b))] *= -1
+
+
+def draw_wall_outlines(surf):
+    """Debug view: outline the merged wall rects inside the viewport."""
+    span = collider.tile_span(camera.rect)
+    for rect in merge_solid_tiles(MAP, TILE_SIZE, region=span):
+        pygame.draw.rect(surf, (230, 200, 40), camera.apply(rect), 1)
+
+
+def draw_agents(surf):
+    view = camera.rect
+    x, y = agents.pos[:, 0], agents.pos[:, 1]
+    visible = agents.alive & (x + AGENT_SIZE > view.left) & (x < view.right) & (y + AGENT_SIZE > view.top) & (y < view.bottom)
+    for ax, ay in (agents.pos[visible] - view.topleft).astype(int).tolist():
+        pygame.draw.rect(surf, AGENT_COLOR, (ax, ay, AGENT_SIZE, AGENT_SIZE))
+
 running = True
+show_walls = False
 while running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F1:
+            show_walls = not show_walls
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Toggle a wall under the cursor; only its chunk is re-rendered
+            wx, wy = event.pos[0] + camera.rect.x, event.pos[1] + camera.rect.y
+            tx, ty = wx // TILE_SIZE, wy // TILE_SIZE
+            if not player.rect.colliderect(Rect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE)):
+                tilemap.set_tile(tx, ty, 0 if tilemap.get_tile(tx, ty) else 1)
 
     keys = pygame.key.get_pressed()
     dx = dy = 0
@@ -95,16 +142,16 @@ while running:
         dy += player.speed
 
     player.move(dx, dy)
+    update_agents()
 
-    # Draw map
-    for y, row in enumerate(MAP):
-        for x, cell in enumerate(row):
-            if cell == 0:
-                SCREEN.blit(FLOOR_IMG, (x*TILE_SIZE, y*TILE_SIZE))
-            else:
-                SCREEN.blit(WALL_IMG, (x*TILE_SIZE, y*TILE_SIZE))
+    # Draw visible chunks only
+    camera.follow(player.rect)
+    renderer.draw(SCREEN, camera)
 
+    draw_agents(SCREEN)
     player.draw(SCREEN)
+    if show_walls:
+        draw_wall_outlines(SCREEN)
     pygame.display.flip()
     CLOCK.tick(60)
 